@@ -0,0 +1,69 @@
+"""Архив завершенных задач
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column("completed_at", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        "ix_tasks_completed_at",
+        "tasks",
+        ["completed_at"],
+        unique=False
+    )
+    # Для уже завершенных задач время завершения неизвестно:
+    # отсчет срока архивации начинается с момента миграции
+    op.execute(
+        "UPDATE tasks SET completed_at = CURRENT_TIMESTAMP "
+        "WHERE status = 'COMPLETED'"
+    )
+
+    op.create_table(
+        "tasks_archive",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "CREATED",
+                "IN_PROGRESS",
+                "COMPLETED",
+                name="taskstatus"
+            ),
+            nullable=False,
+        ),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "INSERT INTO tasks (id, title, description, status, completed_at) "
+        "SELECT id, title, description, status, completed_at "
+        "FROM tasks_archive"
+    )
+    op.drop_table("tasks_archive")
+    op.drop_index("ix_tasks_completed_at", table_name="tasks")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("completed_at")
@@ -0,0 +1,102 @@
+"""Время создания и изменения задач, индексы для сортировки списка
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _add_timestamps(table: str, created_default: str) -> None:
+    """Добавление created_at/updated_at с заполнением старых строк.
+
+    SQLite не добавляет NOT NULL колонку без константного значения
+    по умолчанию, поэтому колонки добавляются как NULL, заполняются
+    и затем таблица пересоздается с NOT NULL.
+    """
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.add_column(
+            sa.Column("created_at", sa.DateTime(), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("updated_at", sa.DateTime(), nullable=True)
+        )
+    op.execute(
+        f"UPDATE {table} SET created_at = {created_default}, "
+        f"updated_at = COALESCE(completed_at, {created_default})"
+    )
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            nullable=False
+        )
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            nullable=False
+        )
+
+
+def upgrade() -> None:
+    # Время создания старых задач неизвестно: используется момент
+    # миграции, порядок между ними определяет rowid
+    _add_timestamps("tasks", "CURRENT_TIMESTAMP")
+    op.create_index(
+        "ix_tasks_created_at",
+        "tasks",
+        ["created_at"],
+        unique=False
+    )
+    op.create_index(
+        "ix_tasks_status_title",
+        "tasks",
+        ["status", "title"],
+        unique=False
+    )
+    op.create_index(
+        "ix_tasks_status_created_at",
+        "tasks",
+        ["status", "created_at"],
+        unique=False
+    )
+
+    _add_timestamps("tasks_archive", "COALESCE(completed_at, archived_at)")
+    op.create_index(
+        "ix_tasks_archive_title",
+        "tasks_archive",
+        ["title"],
+        unique=False
+    )
+    op.create_index(
+        "ix_tasks_archive_created_at",
+        "tasks_archive",
+        ["created_at"],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_archive_created_at", table_name="tasks_archive")
+    op.drop_index("ix_tasks_archive_title", table_name="tasks_archive")
+    with op.batch_alter_table("tasks_archive") as batch_op:
+        batch_op.drop_column("updated_at")
+        batch_op.drop_column("created_at")
+
+    op.drop_index("ix_tasks_status_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_status_title", table_name="tasks")
+    op.drop_index("ix_tasks_created_at", table_name="tasks")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("updated_at")
+        batch_op.drop_column("created_at")
@@ -0,0 +1,35 @@
+"""Индекс архива для сортировки по статусу
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Тот же порядок, что и у ix_tasks_status_created_at: список с
+    # архивом сливает обе таблицы в порядке индексов
+    op.create_index(
+        "ix_tasks_archive_status_created_at",
+        "tasks_archive",
+        ["status", "created_at"],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_tasks_archive_status_created_at",
+        table_name="tasks_archive"
+    )
@@ -0,0 +1,364 @@
+"""Контроль допуска и сброс нагрузки для API задач.
+
+Запросы к /tasks делятся на классы: чтение (GET, HEAD, OPTIONS)
+и запись (остальные методы). Для каждого класса ограничено число
+одновременно выполняемых запросов и длина очереди ожидания.
+Запрос, который не попал в очередь или не дождался слота за
+ADMISSION_TIMEOUT_MS, сразу получает 503 с заголовком Retry-After,
+поэтому задержка допущенных запросов не растет вместе с перегрузкой.
+
+Лимиты ADMISSION_* задаются на весь сервис и делятся между
+WEB_CONCURRENCY воркерами, поэтому число одновременных записей в
+SQLite не растет с числом воркеров. Счетчики каждого воркера хранятся
+в своем слоте общего файла ADMISSION_METRICS_PATH (mmap), и метрики
+суммируются по всем живым воркерам.
+"""
+
+import asyncio
+import json
+import math
+import mmap
+import os
+from typing import Dict, List, Optional
+from app.config import (
+    ADMISSION_METRICS_PATH,
+    ADMISSION_READ_CONCURRENCY,
+    ADMISSION_READ_QUEUE,
+    ADMISSION_RETRY_AFTER_S,
+    ADMISSION_TIMEOUT_MS,
+    ADMISSION_WRITE_CONCURRENCY,
+    ADMISSION_WRITE_QUEUE,
+    WEB_CONCURRENCY,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Счетчики ограничителя в порядке хранения
+COUNTERS = (
+    "in_flight",
+    "queued",
+    "admitted",
+    "shed_queue_full",
+    "shed_timeout",
+)
+
+# Слот воркера в общем файле: pid и счетчики чтения и записи (int64)
+SLOT_SIZE = 1 + 2 * len(COUNTERS)
+MAX_SLOTS = 256
+
+
+class Overloaded(Exception):
+    """Запрос отклонен контролем допуска."""
+
+
+def per_worker_limit(total: int, workers: int) -> int:
+    """Доля лимита сервиса, приходящаяся на один воркер (не меньше 1)."""
+    return max(1, total // max(1, workers))
+
+
+def _local_counters() -> memoryview:
+    """Счетчики в памяти процесса (без общего файла)."""
+    return memoryview(bytearray(8 * len(COUNTERS))).cast("q")
+
+
+def _counter(index: int) -> property:
+    """Свойство, читающее и пишущее счетчик по индексу."""
+    def getter(self) -> int:
+        return self._counters[index]
+
+    def setter(self, value: int) -> None:
+        self._counters[index] = value
+
+    return property(getter, setter)
+
+
+class AdmissionLimiter:
+    """Ограничитель параллелизма с ограниченной очередью.
+
+    Атрибуты:
+        name: Название класса запросов
+        max_concurrency: Максимум одновременно выполняемых запросов
+        max_queue: Максимальная длина очереди ожидания
+        timeout: Максимальное время ожидания в очереди (секунды)
+    """
+
+    in_flight = _counter(0)
+    queued = _counter(1)
+    admitted = _counter(2)
+    shed_queue_full = _counter(3)
+    shed_timeout = _counter(4)
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        timeout: float,
+        counters: Optional[memoryview] = None
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._counters = (
+            counters if counters is not None else _local_counters()
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, counters: memoryview) -> None:
+        """Хранение счетчиков в другом месте (слоте общего файла)."""
+        self._counters = counters
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Семафор, привязанный к текущему циклу событий."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def acquire(self) -> None:
+        """Получение слота.
+
+        Raises:
+            Overloaded: Очередь заполнена или истек срок ожидания
+        """
+        semaphore = self._get_semaphore()
+        if not semaphore.locked():
+            await semaphore.acquire()
+        else:
+            if self.queued >= self.max_queue:
+                self.shed_queue_full += 1
+                raise Overloaded(self.name)
+            self.queued += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.shed_timeout += 1
+                raise Overloaded(self.name) from None
+            finally:
+                self.queued -= 1
+        self.in_flight += 1
+        self.admitted += 1
+
+    def release(self) -> None:
+        """Освобождение слота."""
+        self.in_flight -= 1
+        self._get_semaphore().release()
+
+    def stats(self) -> Dict[str, int]:
+        """Текущее состояние и счетчики ограничителя."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "shed": self.shed_queue_full + self.shed_timeout,
+            "shed_queue_full": self.shed_queue_full,
+            "shed_timeout": self.shed_timeout,
+        }
+
+
+def _is_alive(pid: int) -> bool:
+    """Проверка, что процесс существует."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedCounters:
+    """Слоты счетчиков воркеров в общем файле, отображенном в память.
+
+    Каждый воркер пишет только в свой слот, поэтому запись не требует
+    блокировок; блокировка файла нужна только при захвате слота.
+    Слоты завершившихся процессов переиспользуются.
+    """
+
+    def __init__(self, path: str):
+        size = 8 * SLOT_SIZE * MAX_SLOTS
+        self._file = open(path, "a+b")
+        if os.fstat(self._file.fileno()).st_size < size:
+            self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._values = memoryview(self._mmap).cast("q")
+
+    def _slot(self, index: int) -> memoryview:
+        """Счетчики слота (без pid владельца)."""
+        start = index * SLOT_SIZE
+        return self._values[start + 1:start + SLOT_SIZE]
+
+    def claim_slot(self) -> Optional[memoryview]:
+        """Захват свободного слота текущим процессом.
+
+        Returns:
+            Счетчики слота или None, если свободных слотов нет
+        """
+        pid = os.getpid()
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        try:
+            for index in range(MAX_SLOTS):
+                owner = self._values[index * SLOT_SIZE]
+                if owner in (0, pid) or not _is_alive(owner):
+                    slot = self._slot(index)
+                    for counter in range(len(slot)):
+                        slot[counter] = 0
+                    self._values[index * SLOT_SIZE] = pid
+                    return slot
+            return None
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+
+    def live_slots(self) -> List[memoryview]:
+        """Счетчики всех работающих воркеров."""
+        return [
+            self._slot(index)
+            for index in range(MAX_SLOTS)
+            if self._values[index * SLOT_SIZE] != 0
+            and _is_alive(self._values[index * SLOT_SIZE])
+        ]
+
+
+read_limiter = AdmissionLimiter(
+    "read",
+    per_worker_limit(ADMISSION_READ_CONCURRENCY, WEB_CONCURRENCY),
+    per_worker_limit(ADMISSION_READ_QUEUE, WEB_CONCURRENCY),
+    ADMISSION_TIMEOUT_MS / 1000
+)
+write_limiter = AdmissionLimiter(
+    "write",
+    per_worker_limit(ADMISSION_WRITE_CONCURRENCY, WEB_CONCURRENCY),
+    per_worker_limit(ADMISSION_WRITE_QUEUE, WEB_CONCURRENCY),
+    ADMISSION_TIMEOUT_MS / 1000
+)
+
+_shared: Optional[SharedCounters] = None
+
+
+def _bind_shared_counters() -> None:
+    """Привязка счетчиков ограничителей к слоту этого процесса."""
+    slot = _shared.claim_slot()
+    if slot is not None:
+        read_limiter.bind(slot[:len(COUNTERS)])
+        write_limiter.bind(slot[len(COUNTERS):])
+
+
+if ADMISSION_METRICS_PATH:
+    _shared = SharedCounters(ADMISSION_METRICS_PATH)
+    _bind_shared_counters()
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_bind_shared_counters)
+
+
+def _sum_counters(counters: List[memoryview]) -> Dict[str, int]:
+    """Сумма счетчиков нескольких воркеров."""
+    totals = dict.fromkeys(COUNTERS, 0)
+    for values in counters:
+        for name, value in zip(COUNTERS, values):
+            totals[name] += value
+    return totals
+
+
+def admission_stats() -> Dict[str, object]:
+    """Состояние контроля допуска, суммированное по всем воркерам.
+
+    Без общего файла (один процесс) возвращаются счетчики текущего
+    процесса.
+    """
+    slots = _shared.live_slots() if _shared is not None else []
+    if slots:
+        read = [slot[:len(COUNTERS)] for slot in slots]
+        write = [slot[len(COUNTERS):] for slot in slots]
+    else:
+        read = [read_limiter._counters]
+        write = [write_limiter._counters]
+
+    workers = len(read)
+    result: Dict[str, object] = {"workers": workers}
+    for limiter, counters in (
+        (read_limiter, read),
+        (write_limiter, write),
+    ):
+        totals = _sum_counters(counters)
+        result[limiter.name] = {
+            "max_concurrency": limiter.max_concurrency * workers,
+            "max_queue": limiter.max_queue * workers,
+            "in_flight": totals["in_flight"],
+            "queued": totals["queued"],
+            "admitted": totals["admitted"],
+            "shed": totals["shed_queue_full"] + totals["shed_timeout"],
+            "shed_queue_full": totals["shed_queue_full"],
+            "shed_timeout": totals["shed_timeout"],
+        }
+    return result
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware контроля допуска для запросов с заданным префиксом."""
+
+    def __init__(
+        self,
+        app,
+        prefix: str = "/tasks",
+        read: AdmissionLimiter = read_limiter,
+        write: AdmissionLimiter = write_limiter,
+        retry_after: int = ADMISSION_RETRY_AFTER_S
+    ):
+        self.app = app
+        self.prefix = prefix
+        self.read = read
+        self.write = write
+        self.retry_after = retry_after
+
+    async def __call__(self, scope, receive, send):
+        """Обработка запроса."""
+        if scope["type"] != "http" or not scope["path"].startswith(
+            self.prefix
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        limiter = (
+            self.read if scope["method"] in READ_METHODS else self.write
+        )
+        try:
+            await limiter.acquire()
+        except Overloaded:
+            await self._reject(send, limiter)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def _reject(self, send, limiter: AdmissionLimiter) -> None:
+        """Быстрый ответ 503 с заголовком Retry-After."""
+        body = json.dumps(
+            {"detail": "Сервер перегружен, повторите запрос позже"},
+            ensure_ascii=False
+        ).encode()
+        retry_after = max(1, math.ceil(self.retry_after))
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+                (b"x-admission-class", limiter.name.encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,17 @@
+"""API endpoints для метрик сервиса."""
+
+from fastapi import APIRouter
+from app.admission import admission_stats
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/admission")
+def get_admission_metrics() -> dict:
+    """Состояние контроля допуска, суммированное по всем воркерам.
+
+    - **workers**: Число работающих воркеров
+    - **read** / **write**: Лимиты сервиса, занятые слоты, длина
+      очереди, число допущенных и отклоненных запросов по классам
+    """
+    return admission_stats()
@@ -1,11 +1,18 @@
 """API endpoints для задач."""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.crud.idempotency import IdempotencyConflict, IdempotencyCRUD
 from app.crud.task import TaskCRUD
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.export import (
+    ARROW_STREAM_MEDIA_TYPE,
+    arrow_available,
+    iter_arrow_stream,
+)
+from app.schemas.task import TaskCreate, TaskOrder, TaskUpdate, TaskResponse
 from app.models.task import TaskStatus
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -14,6 +21,14 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 @router.post("/", response_model=TaskResponse, status_code=201)
 def create_task(
     task: TaskCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+        description="Ключ идемпотентности для безопасных повторов"
+    ),
     db: Session = Depends(get_db)
 ) -> TaskResponse:
     """Создание новой задачи.
@@ -21,8 +36,74 @@ def create_task(
     - **title**: Название задачи (обязательно)
     - **description**: Описание задачи (опционально)
     - **status**: Статус задачи (по умолчанию "создано")
+
+    Повтор запроса с тем же заголовком **Idempotency-Key** возвращает
+    сохраненный ответ без создания новой задачи.
+    """
+    if idempotency_key is None:
+        return TaskCRUD.create_task(db=db, task=task)
+
+    try:
+        result, replayed = IdempotencyCRUD.create_task(
+            db=db,
+            key=idempotency_key,
+            task=task
+        )
+    except IdempotencyConflict:
+        raise HTTPException(
+            status_code=422,
+            detail="Ключ идемпотентности уже использован с другими данными"
+        )
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
+
+
+@router.get(
+    "/export.arrow",
+    response_class=StreamingResponse,
+    responses={200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}}}}
+)
+def export_tasks(
+    status: Optional[TaskStatus] = Query(
+        None,
+        description="Фильтр по статусу"
+    ),
+    include_archived: bool = Query(
+        False,
+        description="Включать архивные задачи"
+    ),
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """Выгрузка всех задач в колоночном формате Arrow IPC stream.
+
+    - **status**: Фильтр по статусу (опционально)
+    - **include_archived**: Включать архивные задачи (по умолчанию нет)
+
+    Колонки: id, title, description, status (словарь), completed_at,
+    created_at, updated_at. Ответ передается потоком по мере чтения
+    из базы.
     """
-    return TaskCRUD.create_task(db=db, task=task)
+    if not arrow_available():
+        raise HTTPException(
+            status_code=501,
+            detail="Экспорт недоступен: не установлен pyarrow"
+        )
+    # Поток читается после выхода из обработчика, поэтому использует
+    # собственную сессию на том же движке
+    stream_db = Session(bind=db.get_bind())
+
+    def stream():
+        try:
+            yield from iter_arrow_stream(
+                stream_db,
+                status=status,
+                include_archived=include_archived
+            )
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(stream(), media_type=ARROW_STREAM_MEDIA_TYPE)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
@@ -30,11 +111,11 @@ def get_task(
     task_id: str,
     db: Session = Depends(get_db)
 ) -> TaskResponse:
-    """Получение задачи по ID.
+    """Получение задачи по ID (в том числе из архива).
 
     - **task_id**: Уникальный идентификатор задачи
     """
-    task = TaskCRUD.get_task(db=db, task_id=task_id)
+    task = TaskCRUD.get_task(db=db, task_id=task_id, include_archived=True)
     if task is None:
         raise HTTPException(
             status_code=404,
@@ -60,6 +141,20 @@ def get_tasks(
         None,
         description="Фильтр по статусу"
     ),
+    include_archived: bool = Query(
+        False,
+        description="Включать архивные задачи"
+    ),
+    title_prefix: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=255,
+        description="Фильтр по началу названия"
+    ),
+    order_by: Optional[TaskOrder] = Query(
+        None,
+        description="Сортировка: title, created_at или status"
+    ),
     db: Session = Depends(get_db)
 ) -> List[TaskResponse]:
     """Получение списка задач с пагинацией и фильтрацией.
@@ -68,12 +163,25 @@ def get_tasks(
     - **limit**: Максимальное количество записей
       (по умолчанию 100, максимум 1000)
     - **status**: Фильтр по статусу (опционально)
+    - **include_archived**: Включать архивные задачи (по умолчанию нет)
+    - **title_prefix**: Фильтр по началу названия (опционально,
+      только с сортировкой по title)
+    - **order_by**: Сортировка (по умолчанию created_at, а с
+      title_prefix - title)
     """
+    if title_prefix and order_by not in (None, TaskOrder.TITLE):
+        raise HTTPException(
+            status_code=422,
+            detail="Фильтр title_prefix поддерживает только order_by=title"
+        )
     return TaskCRUD.get_tasks(
         db=db,
         skip=skip,
         limit=limit,
-        status=status
+        status=status,
+        include_archived=include_archived,
+        title_prefix=title_prefix,
+        order_by=order_by
     )
 
 
@@ -89,6 +197,8 @@ def update_task(
     - **title**: Новое название задачи (опционально)
     - **description**: Новое описание задачи (опционально)
     - **status**: Новый статус задачи (опционально)
+
+    Архивные задачи не изменяются: для них возвращается 409.
     """
     task = TaskCRUD.update_task(
         db=db,
@@ -96,6 +206,11 @@ def update_task(
         task_update=task_update
     )
     if task is None:
+        if TaskCRUD.get_task(db, task_id, include_archived=True):
+            raise HTTPException(
+                status_code=409,
+                detail="Задача находится в архиве и не может быть изменена"
+            )
         raise HTTPException(
             status_code=404,
             detail="Задача не найдена"
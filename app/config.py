@@ -0,0 +1,60 @@
+"""Настройки менеджера задач, читаемые из переменных окружения."""
+
+import os
+
+# URL базы данных SQLite
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./tasks.db")
+
+# Применять миграции Alembic при старте приложения (lifespan)
+AUTO_MIGRATE = os.getenv("TASKS_AUTO_MIGRATE", "0") == "1"
+
+# Количество процессов-воркеров (python -m app.serve)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Адрес и порт сервера (python -m app.serve)
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+
+# Сколько SQLite ждет освобождения блокировки перед ошибкой
+# "database is locked" (миллисекунды)
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+
+# Повторы записи при "database is locked" и начальная задержка между ними
+DB_LOCK_RETRIES = int(os.getenv("DB_LOCK_RETRIES", "5"))
+DB_LOCK_BACKOFF_MS = int(os.getenv("DB_LOCK_BACKOFF_MS", "50"))
+
+# Контроль допуска запросов к /tasks. Лимиты задаются на весь сервис
+# и делятся между WEB_CONCURRENCY воркерами (см. app/admission.py)
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "1") == "1"
+ADMISSION_READ_CONCURRENCY = int(
+    os.getenv("ADMISSION_READ_CONCURRENCY", "32")
+)
+ADMISSION_READ_QUEUE = int(os.getenv("ADMISSION_READ_QUEUE", "64"))
+ADMISSION_WRITE_CONCURRENCY = int(
+    os.getenv("ADMISSION_WRITE_CONCURRENCY", "4")
+)
+ADMISSION_WRITE_QUEUE = int(os.getenv("ADMISSION_WRITE_QUEUE", "32"))
+# Сколько запрос может ждать в очереди, прежде чем получит 503
+ADMISSION_TIMEOUT_MS = int(os.getenv("ADMISSION_TIMEOUT_MS", "1000"))
+# Значение заголовка Retry-After для отклоненных запросов (секунды)
+ADMISSION_RETRY_AFTER_S = int(os.getenv("ADMISSION_RETRY_AFTER_S", "1"))
+# Файл общих для воркеров счетчиков (создается python -m app.serve)
+ADMISSION_METRICS_PATH = os.getenv("ADMISSION_METRICS_PATH")
+
+# Срок хранения ключей идемпотентности POST /tasks/ (секунды)
+IDEMPOTENCY_TTL_S = int(os.getenv("IDEMPOTENCY_TTL_S", str(24 * 3600)))
+# Период фоновой очистки просроченных ключей (секунды, 0 - выключено)
+IDEMPOTENCY_CLEANUP_INTERVAL_S = int(
+    os.getenv("IDEMPOTENCY_CLEANUP_INTERVAL_S", "600")
+)
+# Размер пакета удаления при очистке
+IDEMPOTENCY_CLEANUP_BATCH = int(os.getenv("IDEMPOTENCY_CLEANUP_BATCH", "500"))
+
+# Архивация завершенных задач: возраст (секунды с момента завершения),
+# период фонового запуска (секунды, 0 - выключено) и размер пакета
+ARCHIVE_AFTER_S = int(os.getenv("ARCHIVE_AFTER_S", str(30 * 24 * 3600)))
+ARCHIVE_INTERVAL_S = int(os.getenv("ARCHIVE_INTERVAL_S", "300"))
+ARCHIVE_BATCH = int(os.getenv("ARCHIVE_BATCH", "500"))
+
+# Размер пакета строк в колоночном экспорте GET /tasks/export.arrow
+EXPORT_BATCH = int(os.getenv("EXPORT_BATCH", "10000"))
@@ -0,0 +1,134 @@
+"""CRUD операции для ключей идемпотентности."""
+
+import hashlib
+from datetime import timedelta
+from typing import Optional, Tuple
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.config import IDEMPOTENCY_TTL_S
+from app.database import retry_on_locked, utcnow
+from app.crud.task import TaskCRUD
+from app.models.idempotency import IdempotencyKey
+from app.schemas.task import TaskCreate, TaskResponse
+
+
+class IdempotencyConflict(Exception):
+    """Ключ идемпотентности уже использован с другим телом запроса."""
+
+
+def request_hash(payload: str) -> str:
+    """SHA-256 тела запроса."""
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IdempotencyCRUD:
+    """Класс для операций с ключами идемпотентности."""
+
+    @staticmethod
+    def get_response(
+        db: Session,
+        key: str,
+        payload_hash: str
+    ) -> Optional[str]:
+        """Получение сохраненного ответа по ключу.
+
+        Args:
+            db: Сессия базы данных
+            key: Ключ идемпотентности
+            payload_hash: Хеш тела текущего запроса
+
+        Returns:
+            Сохраненный ответ (JSON) или None, если ключа нет
+            или он просрочен
+
+        Raises:
+            IdempotencyConflict: Ключ использован с другим телом запроса
+        """
+        stored = db.get(IdempotencyKey, key)
+        if stored is None or stored.expires_at <= utcnow():
+            return None
+        if stored.request_hash != payload_hash:
+            raise IdempotencyConflict(key)
+        return stored.response
+
+    @staticmethod
+    @retry_on_locked
+    def create_task(
+        db: Session,
+        key: str,
+        task: TaskCreate
+    ) -> Tuple[TaskResponse, bool]:
+        """Создание задачи не более одного раза на ключ.
+
+        Задача и ключ записываются в одной транзакции. Если такой же
+        запрос выполняется параллельно, уникальность ключа оставляет
+        только одну запись, а проигравший запрос возвращает ответ
+        победителя.
+
+        Args:
+            db: Сессия базы данных
+            key: Ключ идемпотентности
+            task: Данные для создания задачи
+
+        Returns:
+            Ответ и признак того, что он взят из сохраненного
+
+        Raises:
+            IdempotencyConflict: Ключ использован с другим телом запроса
+        """
+        payload_hash = request_hash(task.model_dump_json())
+        stored = IdempotencyCRUD.get_response(db, key, payload_hash)
+        if stored is not None:
+            return TaskResponse.model_validate_json(stored), True
+
+        # Просроченный ключ заменяется новым; действующий ключ,
+        # записанный параллельным запросом, не трогается
+        db.execute(
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .where(IdempotencyKey.expires_at <= utcnow())
+        )
+        db_task = TaskCRUD.build_task(task)
+        db.add(db_task)
+        db.flush()
+
+        response = TaskResponse.model_validate(db_task)
+        db.add(IdempotencyKey(
+            key=key,
+            request_hash=payload_hash,
+            response=response.model_dump_json(),
+            expires_at=utcnow() + timedelta(seconds=IDEMPOTENCY_TTL_S)
+        ))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            stored = IdempotencyCRUD.get_response(db, key, payload_hash)
+            if stored is None:
+                raise
+            return TaskResponse.model_validate_json(stored), True
+        return response, False
+
+    @staticmethod
+    @retry_on_locked
+    def purge_expired(db: Session, batch_size: int) -> int:
+        """Удаление одного пакета просроченных ключей.
+
+        Args:
+            db: Сессия базы данных
+            batch_size: Максимальное число удаляемых ключей
+
+        Returns:
+            Количество удаленных ключей
+        """
+        expired = (
+            select(IdempotencyKey.key)
+            .where(IdempotencyKey.expires_at <= utcnow())
+            .limit(batch_size)
+        )
+        result = db.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.key.in_(expired))
+        )
+        db.commit()
+        return result.rowcount
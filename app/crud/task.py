@@ -1,15 +1,172 @@
 """CRUD операции для задач."""
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
+from datetime import datetime
+from typing import List, Optional, Type, Union
+from sqlalchemy import (
+    CompoundSelect,
+    delete,
+    insert,
+    literal,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Query, Session
+from app.database import retry_on_locked, utcnow
+from app.models.task import ArchivedTask, Task, TaskStatus
+from app.schemas.task import TaskCreate, TaskOrder, TaskUpdate
+
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Наименьшая строка, которая больше всех строк с данным префиксом.
+
+    Условие ``prefix <= title < upper`` выполняется как поиск по
+    диапазону индекса, в отличие от ``LIKE 'prefix%'``.
+
+    Returns:
+        Верхняя граница или None, если ее нет
+    """
+    while prefix:
+        code = ord(prefix[-1]) + 1
+        if 0xD800 <= code <= 0xDFFF:
+            code = 0xE000
+        if code <= 0x10FFFF:
+            return prefix[:-1] + chr(code)
+        prefix = prefix[:-1]
+    return None
+
+
+def archive_may_contain(status: Optional[str]) -> bool:
+    """Могут ли в архиве быть задачи с данным статусом.
+
+    В архив переносятся только завершенные задачи. С фильтром по
+    другому статусу архив не читается: иначе запрос прошел бы весь
+    индекс архива, проверяя статус каждой строки.
+    """
+    return status is None or status == TaskStatus.COMPLETED
+
+
+def _list_filters(
+    model: Union[Type[Task], Type[ArchivedTask]],
+    status: Optional[str],
+    title_prefix: Optional[str]
+) -> list:
+    """Условия списка задач одной таблицы.
+
+    Фильтр по статусу к архиву не применяется: архив читается только
+    для статусов, которые в нем могут быть (archive_may_contain).
+    """
+    filters = []
+    if status and model is Task:
+        filters.append(model.status == status)
+    if title_prefix:
+        filters.append(model.title >= title_prefix)
+        upper = prefix_upper_bound(title_prefix)
+        if upper is not None:
+            filters.append(model.title < upper)
+    return filters
+
+
+def _list_order(
+    model: Union[Type[Task], Type[ArchivedTask]],
+    title_prefix: Optional[str],
+    order_by: Optional[TaskOrder]
+) -> list:
+    """Колонки сортировки списка задач одной таблицы."""
+    if order_by is None:
+        order_by = TaskOrder.TITLE if title_prefix else TaskOrder.CREATED_AT
+
+    rowid = literal_column(f"{model.__tablename__}.rowid")
+    if order_by == TaskOrder.TITLE:
+        return [model.title, rowid]
+    if order_by == TaskOrder.STATUS:
+        return [model.status, model.created_at, rowid]
+    return [model.created_at, rowid]
+
+
+def _list_query(
+    db: Session,
+    model: Union[Type[Task], Type[ArchivedTask]],
+    status: Optional[str],
+    title_prefix: Optional[str],
+    order_by: Optional[TaskOrder]
+) -> Query:
+    """Запрос списка задач одной таблицы.
+
+    Каждая сортировка заканчивается rowid: он последний в любом
+    индексе SQLite, поэтому порядок детерминирован и по-прежнему
+    берется из индекса без сортировки во временном B-tree.
+    Поддерживаемые сочетания и их индексы (у архива - индексы
+    ix_tasks_archive_* с теми же колонками):
+
+    - без префикса, сортировка по created_at: ix_tasks_created_at
+      или ix_tasks_status_created_at (с фильтром по статусу);
+    - сортировка по status: ix_tasks_status_created_at;
+    - префикс и/или сортировка по title: ix_tasks_title или
+      ix_tasks_status_title (с фильтром по статусу).
+    """
+    return db.query(model).filter(
+        *_list_filters(model, status, title_prefix)
+    ).order_by(*_list_order(model, title_prefix, order_by))
+
+
+def _merged_list_query(
+    status: Optional[str],
+    title_prefix: Optional[str],
+    order_by: Optional[TaskOrder]
+) -> CompoundSelect:
+    """Запрос списка задач вместе с архивом.
+
+    Обе таблицы читаются по индексам в одном порядке, и SQLite
+    сливает их (MERGE (UNION ALL)) без сортировки, поэтому OFFSET и
+    LIMIT применяются к общему упорядоченному списку одним запросом.
+
+    Returns:
+        Запрос признака архива и ID задач, за которыми следуют
+        колонки сортировки
+    """
+    selects = [
+        select(
+            literal(model is ArchivedTask).label("archived"),
+            model.id,
+            *(
+                column.label(f"key_{i}")
+                for i, column in enumerate(
+                    _list_order(model, title_prefix, order_by)
+                )
+            )
+        ).where(*_list_filters(model, status, title_prefix))
+        for model in (Task, ArchivedTask)
+    ]
+    query = union_all(*selects)
+    return query.order_by(*query.selected_columns[2:])
 
 
 class TaskCRUD:
     """Класс для CRUD операций с задачами."""
 
     @staticmethod
+    def build_task(task: TaskCreate) -> Task:
+        """Создание объекта задачи без записи в базу данных.
+
+        Args:
+            task: Данные для создания задачи
+
+        Returns:
+            Новая задача (время завершения заполнено для
+            задач, созданных сразу в статусе "завершено")
+        """
+        return Task(
+            title=task.title,
+            description=task.description,
+            status=task.status,
+            completed_at=(
+                utcnow() if task.status == TaskStatus.COMPLETED else None
+            )
+        )
+
+    @staticmethod
+    @retry_on_locked
     def create_task(db: Session, task: TaskCreate) -> Task:
         """Создание новой задачи.
 
@@ -20,53 +177,91 @@ class TaskCRUD:
         Returns:
             Созданная задача
         """
-        db_task = Task(
-            title=task.title,
-            description=task.description,
-            status=task.status
-        )
+        db_task = TaskCRUD.build_task(task)
         db.add(db_task)
         db.commit()
         db.refresh(db_task)
         return db_task
 
     @staticmethod
-    def get_task(db: Session, task_id: str) -> Optional[Task]:
+    def get_task(
+        db: Session,
+        task_id: str,
+        include_archived: bool = False
+    ) -> Optional[Union[Task, ArchivedTask]]:
         """Получение задачи по ID.
 
         Args:
             db: Сессия базы данных
             task_id: ID задачи
+            include_archived: Искать также в архиве
 
         Returns:
             Задача или None если не найдена
         """
-        return db.query(Task).filter(Task.id == task_id).first()
+        task = db.query(Task).filter(Task.id == task_id).first()
+        if task is None and include_archived:
+            return db.get(ArchivedTask, task_id)
+        return task
 
     @staticmethod
     def get_tasks(
         db: Session,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[str] = None
-    ) -> List[Task]:
+        status: Optional[str] = None,
+        include_archived: bool = False,
+        title_prefix: Optional[str] = None,
+        order_by: Optional[TaskOrder] = None
+    ) -> List[Union[Task, ArchivedTask]]:
         """Получение списка задач с пагинацией и фильтрацией.
 
+        По умолчанию задачи сортируются по времени создания, а при
+        фильтре по префиксу названия - по названию. Архивные задачи
+        сортируются вместе с задачами из основной таблицы.
+
         Args:
             db: Сессия базы данных
             skip: Количество записей для пропуска
             limit: Максимальное количество записей
             status: Фильтр по статусу
+            include_archived: Включать архивные задачи
+            title_prefix: Фильтр по началу названия
+            order_by: Сортировка
 
         Returns:
             Список задач
         """
-        query = db.query(Task)
-        if status:
-            query = query.filter(Task.status == status)
-        return query.offset(skip).limit(limit).all()
+        if not include_archived or not archive_may_contain(status):
+            query = _list_query(db, Task, status, title_prefix, order_by)
+            return query.offset(skip).limit(limit).all()
+
+        rows = db.execute(
+            _merged_list_query(status, title_prefix, order_by)
+            .offset(skip)
+            .limit(limit)
+        ).all()
+        found = {}
+        for model in (Task, ArchivedTask):
+            ids = [
+                row.id
+                for row in rows
+                if row.archived == (model is ArchivedTask)
+            ]
+            if ids:
+                found.update(
+                    ((model is ArchivedTask, task.id), task)
+                    for task in db.query(model).filter(model.id.in_(ids))
+                )
+        # Задача могла перейти в архив между запросами: она пропускается
+        return [
+            found[row.archived, row.id]
+            for row in rows
+            if (row.archived, row.id) in found
+        ]
 
     @staticmethod
+    @retry_on_locked
     def update_task(
         db: Session,
         task_id: str,
@@ -87,6 +282,12 @@ class TaskCRUD:
             return None
 
         update_data = task_update.model_dump(exclude_unset=True)
+        if update_data.get("status", db_task.status) != db_task.status:
+            db_task.completed_at = (
+                utcnow()
+                if update_data["status"] == TaskStatus.COMPLETED
+                else None
+            )
         for field, value in update_data.items():
             setattr(db_task, field, value)
 
@@ -95,8 +296,9 @@ class TaskCRUD:
         return db_task
 
     @staticmethod
+    @retry_on_locked
     def delete_task(db: Session, task_id: str) -> bool:
-        """Удаление задачи.
+        """Удаление задачи (в том числе архивной).
 
         Args:
             db: Сессия базы данных
@@ -105,10 +307,77 @@ class TaskCRUD:
         Returns:
             True если задача удалена, False если не найдена
         """
-        db_task = TaskCRUD.get_task(db, task_id)
+        db_task = TaskCRUD.get_task(db, task_id, include_archived=True)
         if not db_task:
             return False
 
         db.delete(db_task)
         db.commit()
         return True
+
+    @staticmethod
+    @retry_on_locked
+    def archive_completed(
+        db: Session,
+        completed_before: datetime,
+        batch_size: int
+    ) -> int:
+        """Перенос одного пакета завершенных задач в архив.
+
+        Копирование и удаление выполняются в одной короткой
+        транзакции, поэтому задача всегда находится ровно в одной
+        из таблиц, а блокировка записи держится недолго.
+
+        Args:
+            db: Сессия базы данных
+            completed_before: Архивировать задачи, завершенные раньше
+            batch_size: Максимальное число задач в пакете
+
+        Returns:
+            Количество перенесенных задач
+        """
+        task_ids = db.scalars(
+            select(Task.id)
+            .where(Task.completed_at < completed_before)
+            .where(Task.status == TaskStatus.COMPLETED)
+            .limit(batch_size)
+        ).all()
+        if not task_ids:
+            return 0
+
+        # Условие проверяется повторно внутри транзакции записи: задачу
+        # могли изменить между выбором пакета и его переносом
+        batch = (
+            Task.id.in_(task_ids),
+            Task.completed_at < completed_before,
+            Task.status == TaskStatus.COMPLETED,
+        )
+
+        db.execute(insert(ArchivedTask).from_select(
+            [
+                ArchivedTask.id,
+                ArchivedTask.title,
+                ArchivedTask.description,
+                ArchivedTask.status,
+                ArchivedTask.completed_at,
+                ArchivedTask.created_at,
+                ArchivedTask.updated_at,
+                ArchivedTask.archived_at,
+            ],
+            select(
+                Task.id,
+                Task.title,
+                Task.description,
+                Task.status,
+                Task.completed_at,
+                Task.created_at,
+                Task.updated_at,
+                literal(utcnow(), ArchivedTask.archived_at.type),
+            ).where(*batch)
+        ))
+        result = db.execute(
+            delete(Task).where(*batch),
+            execution_options={"synchronize_session": False}
+        )
+        db.commit()
+        return result.rowcount
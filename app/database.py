@@ -1,31 +1,139 @@
 """Конфигурация базы данных для менеджера задач."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-
-# URL базы данных SQLite
-SQLALCHEMY_DATABASE_URL = "sqlite:///./tasks.db"
-
-# Создание движка базы данных
-engine = create_engine(
+import functools
+import os
+import random
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional, TypeVar
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from app.config import (
+    DB_BUSY_TIMEOUT_MS,
+    DB_LOCK_BACKOFF_MS,
+    DB_LOCK_RETRIES,
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
 )
 
-# Создание фабрики сессий
+T = TypeVar("T")
+
+# Движок создается лениво при первом обращении, а не при импорте,
+# и отдельно в каждом процессе (см. _reset_engine_after_fork)
+_engine: Optional[Engine] = None
+_engine_pid: Optional[int] = None
+
+# Создание фабрики сессий (движок привязывается в get_engine)
 SessionLocal = sessionmaker(
     autocommit=False,
-    autoflush=False,
-    bind=engine
+    autoflush=False
 )
 
 # Базовый класс для моделей
 Base = declarative_base()
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Настройка соединения SQLite для работы из нескольких процессов.
+
+    WAL позволяет читателям не блокироваться пишущим процессом,
+    busy_timeout заставляет SQLite ждать блокировку, а не сразу
+    возвращать "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.close()
+
+
+def get_engine() -> Engine:
+    """Получение движка базы данных.
+
+    Движок создается при первом вызове, поэтому импорт приложения
+    не открывает соединение с базой данных. Каждый процесс (в том
+    числе воркер после fork) создает собственный движок.
+
+    Returns:
+        Движок SQLAlchemy
+    """
+    global _engine, _engine_pid
+    if _engine is None or _engine_pid != os.getpid():
+        _engine = create_engine(
+            SQLALCHEMY_DATABASE_URL,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": DB_BUSY_TIMEOUT_MS / 1000
+            }
+        )
+        if _engine.dialect.name == "sqlite":
+            event.listen(_engine, "connect", _set_sqlite_pragmas)
+        _engine_pid = os.getpid()
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def _reset_engine_after_fork() -> None:
+    """Сброс унаследованного от родителя движка в дочернем процессе.
+
+    Соединения родителя не закрываются (close=False), чтобы не
+    повредить их состояние в родительском процессе.
+    """
+    global _engine, _engine_pid
+    if _engine is not None:
+        _engine.dispose(close=False)
+    _engine = None
+    _engine_pid = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_engine_after_fork)
+
+
+def is_database_locked(error: OperationalError) -> bool:
+    """Проверка, что ошибка вызвана блокировкой SQLite."""
+    return "database is locked" in str(error.orig)
+
+
+def retry_on_locked(func: Callable[..., T]) -> Callable[..., T]:
+    """Повтор операции записи при "database is locked".
+
+    Блокировки между процессами сначала ждет сам SQLite
+    (busy_timeout). Если ожидание не помогло, транзакция
+    откатывается и операция повторяется с экспоненциальной
+    задержкой и случайным разбросом. Сессия передается
+    первым позиционным аргументом или аргументом ``db``.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        db: Session = kwargs.get("db", args[0] if args else None)
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except OperationalError as error:
+                if (
+                    not is_database_locked(error)
+                    or attempt >= DB_LOCK_RETRIES
+                ):
+                    raise
+                db.rollback()
+                delay = DB_LOCK_BACKOFF_MS / 1000 * (2 ** attempt)
+                time.sleep(delay * random.uniform(0.5, 1.5))
+                attempt += 1
+
+    return wrapper
+
+
+def utcnow() -> datetime:
+    """Текущее время UTC без часового пояса (как хранится в SQLite)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def get_db():
     """Генератор для получения сессии базы данных."""
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine())
     try:
         yield db
     finally:
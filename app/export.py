@@ -0,0 +1,211 @@
+"""Колоночный экспорт задач в формате Arrow IPC stream.
+
+Задачи читаются пакетами запросами по кортежам колонок (без ORM
+объектов и Pydantic схем) с keyset пагинацией по (created_at, rowid)
+и сразу кодируются в record batch'и Arrow. Статус кодируется
+словарем с фиксированным набором значений, поэтому словарь
+передается один раз на весь поток. Все пакеты читаются в одной
+транзакции, то есть из одного снимка базы данных.
+
+Требует pyarrow (``pip install task-manager[export]``); модуль
+импортируется лениво, чтобы не замедлять запуск приложения.
+"""
+
+import io
+from datetime import datetime
+from typing import Iterator, Optional, Tuple, Type, Union
+from sqlalchemy import (
+    Select,
+    String,
+    literal_column,
+    select,
+    text,
+    tuple_,
+    type_coerce,
+)
+from sqlalchemy.orm import Session
+from app.config import EXPORT_BATCH
+from app.crud.task import archive_may_contain
+from app.models.task import ArchivedTask, Task, TaskStatus
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Словарь статусов: индекс в словаре по имени, хранимому в базе
+STATUS_DICTIONARY = [status.value for status in TaskStatus]
+STATUS_INDEX = {status.name: i for i, status in enumerate(TaskStatus)}
+
+
+def arrow_available() -> bool:
+    """Проверка наличия pyarrow."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def task_schema():
+    """Схема Arrow для экспорта задач."""
+    import pyarrow as pa
+
+    return pa.schema([
+        pa.field("id", pa.string(), nullable=False),
+        pa.field("title", pa.string(), nullable=False),
+        pa.field("description", pa.string()),
+        pa.field(
+            "status",
+            pa.dictionary(pa.int8(), pa.string()),
+            nullable=False
+        ),
+        pa.field("completed_at", pa.timestamp("us", tz="UTC")),
+        pa.field(
+            "created_at",
+            pa.timestamp("us", tz="UTC"),
+            nullable=False
+        ),
+        pa.field(
+            "updated_at",
+            pa.timestamp("us", tz="UTC"),
+            nullable=False
+        ),
+    ])
+
+
+def export_query(
+    model: Union[Type[Task], Type[ArchivedTask]],
+    status: Optional[TaskStatus],
+    batch_size: int,
+    after: Optional[Tuple[datetime, int]] = None
+) -> Select:
+    """Запрос одного пакета экспорта.
+
+    Keyset пагинация идет по (created_at, rowid): этот порядок дают
+    индексы ix_tasks_created_at и ix_tasks_status_created_at (в архиве
+    ix_tasks_archive_created_at), поэтому каждый пакет читается поиском
+    по диапазону индекса без сортировки во временном B-tree.
+
+    Фильтр по статусу к архиву не применяется, как и в списке задач
+    (см. app.crud.task.archive_may_contain).
+
+    Args:
+        model: Таблица задач (основная или архив)
+        status: Фильтр по статусу
+        batch_size: Количество строк в пакете
+        after: Ключ (created_at, rowid) последней строки прошлого пакета
+
+    Returns:
+        Запрос колонок экспорта и rowid (последняя колонка), который
+        вместе с created_at образует ключ пагинации
+    """
+    rowid = literal_column(f"{model.__tablename__}.rowid")
+    query = select(
+        model.id,
+        model.title,
+        model.description,
+        # Имя статуса как есть, без преобразования в TaskStatus
+        type_coerce(model.status, String),
+        model.completed_at,
+        model.created_at,
+        model.updated_at,
+        rowid,
+    ).order_by(model.created_at, rowid).limit(batch_size)
+    if status is not None and model is Task:
+        query = query.where(model.status == status)
+    if after is not None:
+        query = query.where(tuple_(model.created_at, rowid) > tuple_(*after))
+    return query
+
+
+def _iter_batches(
+    db: Session,
+    model: Union[Type[Task], Type[ArchivedTask]],
+    status: Optional[TaskStatus],
+    batch_size: int
+):
+    """Пакеты строк таблицы в порядке (created_at, rowid)."""
+    after = None
+    while True:
+        rows = db.execute(
+            export_query(model, status, batch_size, after)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+        after = (rows[-1].created_at, rows[-1][-1])
+
+
+def _record_batch(rows, schema, dictionary):
+    """Record batch Arrow из строк пакета экспорта."""
+    import pyarrow as pa
+
+    # Последняя колонка строки - rowid для пагинации
+    (
+        ids, titles, descriptions, statuses, completed, created, updated
+    ) = list(zip(*rows))[:-1]
+    return pa.record_batch([
+        pa.array(ids, pa.string()),
+        pa.array(titles, pa.string()),
+        pa.array(descriptions, pa.string()),
+        pa.DictionaryArray.from_arrays(
+            pa.array([STATUS_INDEX[name] for name in statuses], pa.int8()),
+            dictionary
+        ),
+        pa.array(completed, pa.timestamp("us", tz="UTC")),
+        pa.array(created, pa.timestamp("us", tz="UTC")),
+        pa.array(updated, pa.timestamp("us", tz="UTC")),
+    ], schema=schema)
+
+
+def iter_arrow_stream(
+    db: Session,
+    status: Optional[TaskStatus] = None,
+    include_archived: bool = False,
+    batch_size: int = EXPORT_BATCH
+) -> Iterator[bytes]:
+    """Поток Arrow IPC с задачами.
+
+    Поток читается в одной транзакции, которая завершается вместе
+    с ним, поэтому сессия не должна иметь открытой транзакции.
+
+    Args:
+        db: Сессия базы данных
+        status: Фильтр по статусу
+        include_archived: Включать архивные задачи
+        batch_size: Количество строк в одном record batch
+
+    Returns:
+        Итератор по частям потока Arrow IPC
+    """
+    import pyarrow as pa
+
+    schema = task_schema()
+    dictionary = pa.array(STATUS_DICTIONARY, pa.string())
+    sink = io.BytesIO()
+
+    def flush() -> bytes:
+        chunk = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return chunk
+
+    models = [Task]
+    if include_archived and archive_may_contain(status):
+        models.append(ArchivedTask)
+    # pysqlite не открывает транзакцию для SELECT: без явного BEGIN
+    # каждый пакет видел бы свой снимок, и задача, перенесенная в архив
+    # во время выгрузки, попала бы в поток дважды
+    db.execute(text("BEGIN"))
+    try:
+        with pa.ipc.new_stream(sink, schema) as writer:
+            yield flush()
+            for model in models:
+                for rows in _iter_batches(db, model, status, batch_size):
+                    writer.write_batch(
+                        _record_batch(rows, schema, dictionary)
+                    )
+                    yield flush()
+        yield flush()
+    finally:
+        db.rollback()
@@ -1,13 +1,31 @@
 """Главное приложение менеджера задач."""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine
-from app.models import task
-from app.api import tasks
+from app.admission import AdmissionControlMiddleware
+from app.config import ADMISSION_ENABLED, AUTO_MIGRATE
+from app.maintenance import start_jobs, stop_jobs
+from app.api import metrics, tasks
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Жизненный цикл приложения.
+
+    Схема базы данных управляется миграциями Alembic
+    (``python -m app.migrate``). При TASKS_AUTO_MIGRATE=1 миграции
+    применяются при старте приложения. Фоновые задачи обслуживания
+    работают, пока работает приложение.
+    """
+    if AUTO_MIGRATE:
+        from app.migrate import upgrade_database
+
+        upgrade_database()
+    jobs = start_jobs()
+    yield
+    await stop_jobs(jobs)
 
-# Создание таблиц в базе данных
-task.Base.metadata.create_all(bind=engine)
 
 # Создание приложения FastAPI
 app = FastAPI(
@@ -15,9 +33,15 @@ app = FastAPI(
     description="API для управления задачами с CRUD операциями",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
+# Контроль допуска к /tasks (подключается до CORS, чтобы ответы 503
+# тоже получали CORS заголовки)
+if ADMISSION_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware)
+
 # Настройка CORS
 app.add_middleware(
     CORSMiddleware,
@@ -29,6 +53,7 @@ app.add_middleware(
 
 # Подключение роутеров
 app.include_router(tasks.router)
+app.include_router(metrics.router)
 
 
 @app.get("/")
@@ -0,0 +1,104 @@
+"""Фоновое обслуживание базы данных.
+
+Задачи запускаются из lifespan приложения в каждом воркере. Все
+состояние хранится в базе данных, поэтому одновременный запуск в
+нескольких воркерах безопасен.
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Callable, List
+from starlette.concurrency import run_in_threadpool
+from app.config import (
+    ARCHIVE_AFTER_S,
+    ARCHIVE_BATCH,
+    ARCHIVE_INTERVAL_S,
+    IDEMPOTENCY_CLEANUP_BATCH,
+    IDEMPOTENCY_CLEANUP_INTERVAL_S,
+)
+from app.crud.idempotency import IdempotencyCRUD
+from app.crud.task import TaskCRUD
+from app.database import SessionLocal, get_engine, utcnow
+
+logger = logging.getLogger(__name__)
+
+
+def purge_idempotency_keys(
+    batch_size: int = IDEMPOTENCY_CLEANUP_BATCH
+) -> int:
+    """Удаление просроченных ключей идемпотентности пакетами.
+
+    Каждый пакет удаляется в отдельной короткой транзакции, чтобы
+    не держать блокировку записи SQLite.
+
+    Returns:
+        Количество удаленных ключей
+    """
+    total = 0
+    db = SessionLocal(bind=get_engine())
+    try:
+        while True:
+            deleted = IdempotencyCRUD.purge_expired(db, batch_size)
+            total += deleted
+            if deleted < batch_size:
+                return total
+    finally:
+        db.close()
+
+
+def archive_completed_tasks(
+    older_than_s: int = ARCHIVE_AFTER_S,
+    batch_size: int = ARCHIVE_BATCH
+) -> int:
+    """Перенос завершенных задач старше older_than_s в архив пакетами.
+
+    Returns:
+        Количество перенесенных задач
+    """
+    completed_before = utcnow() - timedelta(seconds=older_than_s)
+    total = 0
+    db = SessionLocal(bind=get_engine())
+    try:
+        while True:
+            moved = TaskCRUD.archive_completed(
+                db, completed_before, batch_size
+            )
+            total += moved
+            if moved < batch_size:
+                return total
+    finally:
+        db.close()
+
+
+async def run_periodically(job: Callable[[], object], interval: float):
+    """Периодический запуск синхронной задачи в пуле потоков."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(job)
+        except Exception:
+            logger.exception("Ошибка фоновой задачи %s", job.__name__)
+
+
+def start_jobs() -> List[asyncio.Task]:
+    """Запуск включенных фоновых задач."""
+    jobs = []
+    if IDEMPOTENCY_CLEANUP_INTERVAL_S > 0:
+        jobs.append(asyncio.create_task(run_periodically(
+            purge_idempotency_keys,
+            IDEMPOTENCY_CLEANUP_INTERVAL_S
+        )))
+    if ARCHIVE_INTERVAL_S > 0:
+        jobs.append(asyncio.create_task(run_periodically(
+            archive_completed_tasks,
+            ARCHIVE_INTERVAL_S
+        )))
+    return jobs
+
+
+async def stop_jobs(jobs: List[asyncio.Task]) -> None:
+    """Остановка фоновых задач."""
+    for job in jobs:
+        job.cancel()
+    await asyncio.gather(*jobs, return_exceptions=True)
@@ -0,0 +1,114 @@
+"""Управление схемой базы данных через миграции Alembic.
+
+Запуск вручную:
+
+    python -m app.migrate
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+from sqlalchemy import inspect
+from sqlalchemy.engine import make_url
+from app.config import SQLALCHEMY_DATABASE_URL
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Путь к alembic.ini в корне проекта
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+# Ревизия, соответствующая схеме, которую раньше создавал create_all
+BASELINE_REVISION = "0001"
+
+
+def get_alembic_config(database_url: Optional[str] = None):
+    """Создание конфигурации Alembic.
+
+    Args:
+        database_url: URL базы данных (по умолчанию из настроек)
+
+    Returns:
+        Конфигурация Alembic
+    """
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    # Логирование настраивает приложение (uvicorn), а не alembic.ini
+    config.attributes["configure_logger"] = False
+    config.set_main_option(
+        "script_location",
+        str(ALEMBIC_INI.parent / "alembic")
+    )
+    config.set_main_option(
+        "sqlalchemy.url",
+        database_url or SQLALCHEMY_DATABASE_URL
+    )
+    return config
+
+
+@contextmanager
+def _migration_lock(database_url: str) -> Iterator[None]:
+    """Межпроцессная блокировка на время применения миграций.
+
+    Несколько воркеров, стартующих одновременно, применяют миграции
+    по очереди, а не параллельно.
+    """
+    url = make_url(database_url)
+    database = url.database
+    if (
+        fcntl is None
+        or not url.get_backend_name() == "sqlite"
+        or not database
+        or database == ":memory:"
+    ):
+        yield
+        return
+
+    lock_path = f"{os.path.abspath(database)}.migrate.lock"
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def upgrade_database(
+    database_url: Optional[str] = None,
+    revision: str = "head"
+) -> None:
+    """Применение миграций к базе данных.
+
+    Базы, созданные ранее через create_all (таблица tasks есть,
+    а alembic_version нет), помечаются базовой ревизией перед
+    применением остальных миграций.
+
+    Args:
+        database_url: URL базы данных (по умолчанию из настроек)
+        revision: Целевая ревизия
+    """
+    from alembic import command
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import NullPool
+
+    database_url = database_url or SQLALCHEMY_DATABASE_URL
+    config = get_alembic_config(database_url)
+
+    with _migration_lock(database_url):
+        engine = create_engine(database_url, poolclass=NullPool)
+        try:
+            tables = set(inspect(engine).get_table_names())
+        finally:
+            engine.dispose()
+
+        if "tasks" in tables and "alembic_version" not in tables:
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, revision)
+
+
+if __name__ == "__main__":
+    upgrade_database()
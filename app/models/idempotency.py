@@ -0,0 +1,29 @@
+"""Модель ключа идемпотентности."""
+
+from sqlalchemy import Column, DateTime, String, Text
+from app.database import Base
+
+
+class IdempotencyKey(Base):
+    """Сохраненный ответ на запрос с заголовком Idempotency-Key.
+
+    Атрибуты:
+        key: Значение заголовка Idempotency-Key
+        request_hash: SHA-256 тела исходного запроса
+        response: Тело исходного ответа (JSON)
+        expires_at: Момент, после которого ключ можно удалить (UTC)
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(255), primary_key=True)
+    request_hash = Column(String(64), nullable=False)
+    response = Column(Text, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        """Строковое представление ключа."""
+        return (
+            f"<IdempotencyKey(key='{self.key}', "
+            f"expires_at='{self.expires_at}')>"
+        )
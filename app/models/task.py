@@ -2,8 +2,8 @@
 
 import uuid
 from enum import Enum
-from sqlalchemy import Column, String, Text, Enum as SQLEnum
-from app.database import Base
+from sqlalchemy import Column, DateTime, Index, String, Text, Enum as SQLEnum
+from app.database import Base, utcnow
 
 
 class TaskStatus(str, Enum):
@@ -22,9 +22,19 @@ class Task(Base):
         title: Название задачи
         description: Описание задачи
         status: Статус задачи (создано, в работе, завершено)
+        completed_at: Момент перевода в статус "завершено" (UTC)
+        created_at: Момент создания (UTC)
+        updated_at: Момент последнего изменения (UTC)
+
+    Индексы покрывают фильтр по статусу, префиксу названия и
+    сортировки списка задач (см. TaskCRUD.get_tasks).
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_status_title", "status", "title"),
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+    )
 
     id = Column(
         String(36),
@@ -38,6 +48,19 @@ class Task(Base):
         default=TaskStatus.CREATED,
         nullable=False
     )
+    completed_at = Column(DateTime, nullable=True, index=True)
+    created_at = Column(
+        DateTime,
+        default=utcnow,
+        nullable=False,
+        index=True
+    )
+    updated_at = Column(
+        DateTime,
+        default=utcnow,
+        onupdate=utcnow,
+        nullable=False
+    )
 
     def __repr__(self):
         """Строковое представление задачи."""
@@ -45,3 +68,45 @@ class Task(Base):
             f"<Task(id={self.id}, title='{self.title}', "
             f"status='{self.status}')>"
         )
+
+
+class ArchivedTask(Base):
+    """Архивная (холодная) задача.
+
+    Завершенные задачи старше ARCHIVE_AFTER_S переносятся из таблицы
+    tasks в tasks_archive и больше не изменяются.
+
+    Атрибуты:
+        id: Уникальный идентификатор задачи (UUID)
+        title: Название задачи
+        description: Описание задачи
+        status: Статус задачи (всегда "завершено")
+        completed_at: Момент перевода в статус "завершено" (UTC)
+        created_at: Момент создания (UTC)
+        updated_at: Момент последнего изменения (UTC)
+        archived_at: Момент переноса в архив (UTC)
+
+    Индексы повторяют индексы сортировки таблицы tasks, чтобы список
+    с архивом читал обе таблицы в одном порядке.
+    """
+
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        Index("ix_tasks_archive_status_created_at", "status", "created_at"),
+    )
+
+    id = Column(String(36), primary_key=True)
+    title = Column(String(255), nullable=False, index=True)
+    description = Column(Text, nullable=True)
+    status = Column(SQLEnum(TaskStatus), nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False, index=True)
+    updated_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        """Строковое представление архивной задачи."""
+        return (
+            f"<ArchivedTask(id={self.id}, title='{self.title}', "
+            f"archived_at='{self.archived_at}')>"
+        )
@@ -1,10 +1,20 @@
 """Pydantic схемы для задач."""
 
+from datetime import datetime
+from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field
 from app.models.task import TaskStatus
 
 
+class TaskOrder(str, Enum):
+    """Сортировки списка задач."""
+
+    TITLE = "title"
+    CREATED_AT = "created_at"
+    STATUS = "status"
+
+
 class TaskBase(BaseModel):
     """Базовая схема задачи."""
 
@@ -56,5 +66,13 @@ class TaskResponse(TaskBase):
         ...,
         description="Уникальный идентификатор задачи"
     )
+    created_at: Optional[datetime] = Field(
+        None,
+        description="Время создания задачи (UTC)"
+    )
+    updated_at: Optional[datetime] = Field(
+        None,
+        description="Время последнего изменения задачи (UTC)"
+    )
 
     model_config = {"from_attributes": True}
@@ -0,0 +1,68 @@
+"""Запуск менеджера задач в одном или нескольких процессах.
+
+Запуск:
+
+    python -m app.serve --workers 4
+
+Миграции применяются один раз в главном процессе, затем uvicorn
+запускает воркеры. Каждый воркер импортирует приложение заново и
+создает собственный движок базы данных (см. app.database.get_engine).
+Данные, общие для всех воркеров (ключи идемпотентности, архив),
+хранятся в базе данных. Лимиты контроля допуска делятся между
+воркерами, а их счетчики собираются в общем файле, который создает
+launcher (см. app.admission).
+"""
+
+import argparse
+import os
+import tempfile
+import uvicorn
+
+
+def main() -> None:
+    """Точка входа launcher'а."""
+    parser = argparse.ArgumentParser(description="Запуск менеджера задач")
+    parser.add_argument("--host", help="По умолчанию HOST")
+    parser.add_argument("--port", type=int, help="По умолчанию PORT")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="По умолчанию WEB_CONCURRENCY"
+    )
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument(
+        "--no-migrate",
+        action="store_true",
+        help="Не применять миграции перед запуском"
+    )
+    args = parser.parse_args()
+
+    # Воркеры читают настройки из окружения при импорте приложения
+    if args.workers is not None:
+        os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    fd, metrics_path = tempfile.mkstemp(prefix="tasks-admission-")
+    os.close(fd)
+    os.environ["ADMISSION_METRICS_PATH"] = metrics_path
+    try:
+        # Настройки читаются при импорте, поэтому импортируются после
+        # настройки окружения: с одним воркером uvicorn запускает
+        # приложение в этом же процессе
+        from app.config import HOST, PORT, WEB_CONCURRENCY
+        from app.migrate import upgrade_database
+
+        if not args.no_migrate:
+            upgrade_database()
+
+        uvicorn.run(
+            "app.main:app",
+            host=HOST if args.host is None else args.host,
+            port=PORT if args.port is None else args.port,
+            workers=WEB_CONCURRENCY,
+            log_level=args.log_level
+        )
+    finally:
+        os.unlink(metrics_path)
+
+
+if __name__ == "__main__":
+    main()
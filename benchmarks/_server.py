@@ -0,0 +1,83 @@
+"""Общие утилиты бенчмарков: запуск сервера на временной базе."""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def server_env(database_url: str) -> Dict[str, str]:
+    """Окружение дочерних процессов с отдельной базой данных."""
+    env = os.environ.copy()
+    env["DATABASE_URL"] = database_url
+    env["TASKS_AUTO_MIGRATE"] = "0"
+    return env
+
+
+def free_port() -> int:
+    """Свободный TCP порт на localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(url: str, timeout: float) -> float:
+    """Ожидание первого успешного ответа; возвращает время ожидания."""
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter() - started
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.01)
+    raise TimeoutError("Приложение не ответило за отведенное время")
+
+
+@contextmanager
+def run_server(
+    env: Dict[str, str],
+    workers: int = 1,
+    extra_args: Optional[List[str]] = None,
+    timeout: float = 30.0
+) -> Iterator[str]:
+    """Запуск ``python -m app.serve``; возвращает базовый URL."""
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "app.serve",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+            *(extra_args or [])
+        ],
+        cwd=PROJECT_ROOT,
+        env=env
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(f"{base_url}/health", timeout)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def post_json(url: str, payload: dict) -> dict:
+    """POST запрос с JSON телом."""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.loads(response.read())
@@ -0,0 +1,125 @@
+"""Бенчмарк колоночного экспорта против постраничного JSON списка.
+
+Наполняет временную базу задачами, затем выгружает их все:
+    - через GET /tasks/?skip=...&limit=1000 (JSON, постранично);
+    - через GET /tasks/export.arrow (Arrow IPC stream, один запрос).
+
+Для каждого способа выводит переданные байты и полное время, включая
+разбор ответа на клиенте.
+
+Запуск:
+
+    python -m benchmarks.export --tasks 1000000
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import uuid
+from datetime import datetime, timezone
+from typing import Tuple
+from benchmarks._server import PROJECT_ROOT, run_server, server_env
+
+STATUSES = ["CREATED", "IN_PROGRESS", "COMPLETED"]
+SEED_BATCH = 50000
+PAGE_SIZE = 1000
+
+
+def seed(path: str, count: int) -> None:
+    """Быстрое наполнение таблицы tasks напрямую через sqlite3."""
+    connection = sqlite3.connect(path)
+    now = datetime.now(timezone.utc).replace(tzinfo=None).isoformat(" ")
+    for start in range(0, count, SEED_BATCH):
+        connection.executemany(
+            "INSERT INTO tasks "
+            "(id, title, description, status, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    str(uuid.uuid4()),
+                    f"Задача {i}",
+                    f"Описание задачи {i}" if i % 2 else None,
+                    random.choice(STATUSES),
+                    now,
+                    now,
+                )
+                for i in range(start, min(start + SEED_BATCH, count))
+            ]
+        )
+        connection.commit()
+    connection.close()
+
+
+def fetch_json(base_url: str) -> Tuple[int, int, float]:
+    """Выгрузка через JSON список; возвращает задачи, байты и время."""
+    started = time.perf_counter()
+    total_bytes = 0
+    total_tasks = 0
+    skip = 0
+    while True:
+        url = f"{base_url}/tasks/?skip={skip}&limit={PAGE_SIZE}"
+        with urllib.request.urlopen(url, timeout=600) as response:
+            body = response.read()
+        total_bytes += len(body)
+        page = json.loads(body)
+        total_tasks += len(page)
+        if len(page) < PAGE_SIZE:
+            return total_tasks, total_bytes, time.perf_counter() - started
+        skip += PAGE_SIZE
+
+
+def fetch_arrow(base_url: str) -> Tuple[int, int, float]:
+    """Выгрузка через Arrow IPC; возвращает задачи, байты и время."""
+    import pyarrow as pa
+
+    started = time.perf_counter()
+    url = f"{base_url}/tasks/export.arrow"
+    with urllib.request.urlopen(url, timeout=600) as response:
+        body = response.read()
+    table = pa.ipc.open_stream(body).read_all()
+    return table.num_rows, len(body), time.perf_counter() - started
+
+
+def main() -> int:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/export.db"
+        env = server_env(f"sqlite:///{path}")
+        subprocess.check_call(
+            [sys.executable, "-m", "app.migrate"],
+            cwd=PROJECT_ROOT,
+            env=env
+        )
+        seed(path, args.tasks)
+
+        with run_server(env, extra_args=["--no-migrate"]) as base_url:
+            results = {
+                "arrow": fetch_arrow(base_url),
+                "json": fetch_json(base_url),
+            }
+
+    print(f"{'format':<6} {'tasks':>9} {'MB':>9} {'seconds':>9}")
+    for name, (tasks, size, elapsed) in results.items():
+        print(
+            f"{name:<6} {tasks:>9} {size / 2 ** 20:>9.1f} {elapsed:>9.2f}"
+        )
+    arrow, plain = results["arrow"], results["json"]
+    print(
+        f"arrow/json: bytes x{arrow[1] / plain[1]:.2f}, "
+        f"time x{arrow[2] / plain[2]:.2f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
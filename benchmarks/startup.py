@@ -0,0 +1,121 @@
+"""Бенчмарк времени запуска приложения.
+
+Измеряет:
+    - время импорта ``app.main`` в чистом интерпретаторе;
+    - время от запуска uvicorn до первого успешного ответа API.
+
+Запуск:
+
+    python -m benchmarks.startup --runs 5 \\
+        --max-import-ms 2000 --max-first-response-ms 5000
+
+При превышении порогов скрипт завершается с кодом 1 (для CI).
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+from benchmarks._server import (
+    PROJECT_ROOT,
+    free_port,
+    server_env,
+    wait_until_ready,
+)
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def measure_import(env: Dict[str, str]) -> float:
+    """Время импорта app.main в секундах."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=PROJECT_ROOT,
+        env=env,
+        text=True
+    )
+    return float(output.strip())
+
+
+def measure_first_response(env: Dict[str, str], timeout: float) -> float:
+    """Время от запуска uvicorn до первого ответа GET /tasks/."""
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning"
+        ],
+        cwd=PROJECT_ROOT,
+        env=env
+    )
+    try:
+        wait_until_ready(f"http://127.0.0.1:{port}/tasks/?limit=1", timeout)
+        return time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def _summary(name: str, samples: List[float]) -> float:
+    """Печать статистики и возврат медианы в миллисекундах."""
+    values = [sample * 1000 for sample in samples]
+    median = statistics.median(values)
+    print(
+        f"{name:<22} median={median:8.1f} ms  "
+        f"min={min(values):8.1f} ms  max={max(values):8.1f} ms"
+    )
+    return median
+
+
+def main() -> int:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-first-response-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = server_env(f"sqlite:///{tmp}/startup.db")
+        subprocess.check_call(
+            [sys.executable, "-m", "app.migrate"],
+            cwd=PROJECT_ROOT,
+            env=env
+        )
+
+        import_samples = [measure_import(env) for _ in range(args.runs)]
+        response_samples = [
+            measure_first_response(env, args.timeout)
+            for _ in range(args.runs)
+        ]
+
+    import_ms = _summary("import app.main", import_samples)
+    response_ms = _summary("time to first response", response_samples)
+
+    failed = False
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"FAIL: import {import_ms:.1f} ms > {args.max_import_ms} ms")
+        failed = True
+    if (
+        args.max_first_response_ms is not None
+        and response_ms > args.max_first_response_ms
+    ):
+        print(
+            f"FAIL: first response {response_ms:.1f} ms > "
+            f"{args.max_first_response_ms} ms"
+        )
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
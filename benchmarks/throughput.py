@@ -0,0 +1,155 @@
+"""Бенчмарк масштабирования пропускной способности по числу воркеров.
+
+Для каждого числа воркеров (1, 2, 4, ... N) и каждой смеси запросов
+запускает ``python -m app.serve`` на временной базе и нагружает его
+параллельными клиентами (отдельные процессы, keep-alive соединения).
+
+Смеси:
+    - read:  90% GET /tasks/{id} и GET /tasks/, 10% POST /tasks/
+    - write: 10% чтений, 90% POST /tasks/ и PUT /tasks/{id}
+
+Запуск:
+
+    python -m benchmarks.throughput --max-workers 4 --duration 5
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+from urllib.parse import urlparse
+from benchmarks._server import post_json, run_server, server_env
+
+MIXES = {"read": 0.9, "write": 0.1}
+SEED_TASKS = 200
+
+
+def _client(
+    base_url: str,
+    task_ids: List[str],
+    read_ratio: float,
+    duration: float
+) -> Tuple[List[float], int]:
+    """Один клиент: запросы в цикле; возвращает задержки и ошибки."""
+    url = urlparse(base_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port)
+    headers = {"Content-Type": "application/json"}
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        if random.random() < read_ratio:
+            if random.random() < 0.5:
+                method, path, body = (
+                    "GET", f"/tasks/{random.choice(task_ids)}", None
+                )
+            else:
+                method, path, body = "GET", "/tasks/?limit=20", None
+        elif random.random() < 0.5:
+            method, path = "POST", "/tasks/"
+            body = json.dumps({"title": "bench"})
+        else:
+            method, path = "PUT", f"/tasks/{random.choice(task_ids)}"
+            body = json.dumps({"description": str(random.random())})
+
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(url.hostname, url.port)
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+    return latencies, errors
+
+
+def run_mix(
+    workers: int,
+    read_ratio: float,
+    clients: int,
+    duration: float
+) -> Tuple[float, float, float, int]:
+    """Прогон одной конфигурации; возвращает rps, p50, p99 и ошибки."""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = server_env(f"sqlite:///{tmp}/throughput.db")
+        with run_server(env, workers=workers) as base_url:
+            task_ids = [
+                post_json(f"{base_url}/tasks/", {"title": f"seed {i}"})["id"]
+                for i in range(SEED_TASKS)
+            ]
+            with ProcessPoolExecutor(max_workers=clients) as pool:
+                futures = [
+                    pool.submit(
+                        _client, base_url, task_ids, read_ratio, duration
+                    )
+                    for _ in range(clients)
+                ]
+                results = [future.result() for future in futures]
+
+    latencies = sorted(
+        latency for client_latencies, _ in results
+        for latency in client_latencies
+    )
+    errors = sum(client_errors for _, client_errors in results)
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0
+    return (
+        len(latencies) / duration,
+        statistics.median(latencies) * 1000 if latencies else 0.0,
+        p99 * 1000,
+        errors
+    )
+
+
+def main() -> int:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--max-workers", type=int, default=min(os.cpu_count() or 1, 8)
+    )
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--mix", choices=[*MIXES, "all"], default="all"
+    )
+    args = parser.parse_args()
+
+    worker_counts = []
+    workers = 1
+    while workers < args.max_workers:
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(args.max_workers)
+
+    mixes = MIXES if args.mix == "all" else {args.mix: MIXES[args.mix]}
+    print(
+        f"{'mix':<6} {'workers':>7} {'req/s':>9} {'scale':>6} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'errors':>7}"
+    )
+    for mix, read_ratio in mixes.items():
+        baseline = None
+        for workers in worker_counts:
+            rps, p50, p99, errors = run_mix(
+                workers, read_ratio, args.clients, args.duration
+            )
+            baseline = baseline or rps
+            print(
+                f"{mix:<6} {workers:>7} {rps:>9.1f} {rps / baseline:>6.2f} "
+                f"{p50:>8.1f} {p99:>8.1f} {errors:>7}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
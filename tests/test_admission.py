@@ -0,0 +1,182 @@
+"""Тесты контроля допуска и сброса нагрузки."""
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from app import admission
+from app.admission import (
+    AdmissionLimiter,
+    Overloaded,
+    SharedCounters,
+    per_worker_limit,
+)
+
+# Процесс-воркер: захватывает слот, меняет счетчики и ждет stdin
+WORKER_SNIPPET = (
+    "import sys, app.admission as a; "
+    "a.read_limiter.admitted += 2; "
+    "a.write_limiter.shed_timeout += 3; "
+    "print('ready', flush=True); sys.stdin.read()"
+)
+
+# Launcher с одним воркером: вместо запуска сервера печатает лимит
+# чтения приложения в этом же процессе и число воркеров
+SERVE_SNIPPET = (
+    "import sys, uvicorn; "
+    "uvicorn.run = lambda app, **kwargs: print("
+    "__import__('app.admission').admission.read_limiter.max_concurrency, "
+    "kwargs['workers']); "
+    "sys.argv = ['serve', '--workers', '1', '--no-migrate']; "
+    "import app.serve; app.serve.main()"
+)
+
+
+class TestAdmissionLimiter:
+    """Тесты ограничителя параллелизма."""
+
+    @pytest.mark.asyncio
+    async def test_admits_within_limit(self):
+        """Тест допуска запросов в пределах лимита."""
+        limiter = AdmissionLimiter("read", 2, 0, 0.1)
+
+        await limiter.acquire()
+        await limiter.acquire()
+
+        assert limiter.stats()["in_flight"] == 2
+        assert limiter.stats()["admitted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_queue_full(self):
+        """Тест отклонения запроса при заполненной очереди."""
+        limiter = AdmissionLimiter("write", 1, 0, 1.0)
+        await limiter.acquire()
+
+        with pytest.raises(Overloaded):
+            await limiter.acquire()
+        assert limiter.stats()["shed_queue_full"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sheds_after_deadline(self):
+        """Тест отклонения запроса, не дождавшегося слота."""
+        limiter = AdmissionLimiter("write", 1, 1, 0.01)
+        await limiter.acquire()
+
+        with pytest.raises(Overloaded):
+            await limiter.acquire()
+        stats = limiter.stats()
+        assert stats["shed_timeout"] == 1
+        assert stats["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queued_request_admitted_after_release(self):
+        """Тест допуска запроса из очереди после освобождения слота."""
+        limiter = AdmissionLimiter("write", 1, 1, 1.0)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.stats()["queued"] == 1
+
+        limiter.release()
+        await waiter
+
+        stats = limiter.stats()
+        assert stats["in_flight"] == 1
+        assert stats["queued"] == 0
+        assert stats["admitted"] == 2
+
+
+class TestSharedCounters:
+    """Тесты лимитов и счетчиков нескольких воркеров."""
+
+    def test_per_worker_limit(self):
+        """Тест деления лимита сервиса между воркерами."""
+        assert per_worker_limit(4, 1) == 4
+        assert per_worker_limit(4, 2) == 2
+        assert per_worker_limit(4, 8) == 1
+
+    def test_stats_aggregated_across_processes(self, tmp_path, monkeypatch):
+        """Тест суммирования счетчиков воркеров из общего файла."""
+        path = tmp_path / "admission"
+        worker = subprocess.Popen(
+            [sys.executable, "-c", WORKER_SNIPPET],
+            cwd=Path(__file__).resolve().parent.parent,
+            env={**os.environ, "ADMISSION_METRICS_PATH": str(path)},
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        try:
+            assert worker.stdout.readline().strip() == "ready"
+            shared = SharedCounters(str(path))
+            monkeypatch.setattr(admission, "_shared", shared)
+            monkeypatch.setattr(
+                admission.read_limiter,
+                "_counters",
+                shared.claim_slot()[:len(admission.COUNTERS)]
+            )
+            admission.read_limiter.admitted += 1
+
+            stats = admission.admission_stats()
+        finally:
+            worker.communicate("")
+
+        assert stats["workers"] == 2
+        assert stats["read"]["admitted"] == 3
+        assert stats["write"]["shed"] == 3
+        # Слот завершившегося воркера не учитывается
+        assert len(shared.live_slots()) == 1
+
+
+    def test_serve_workers_override_environment(self):
+        """Тест: --workers 1 применяется к приложению в том же процессе."""
+        result = subprocess.run(
+            [sys.executable, "-c", SERVE_SNIPPET],
+            cwd=Path(__file__).resolve().parent.parent,
+            env={
+                **os.environ,
+                "WEB_CONCURRENCY": "4",
+                "ADMISSION_READ_CONCURRENCY": "32",
+            },
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["32", "1"]
+
+
+class TestAdmissionAPI:
+    """Тесты контроля допуска на уровне API."""
+
+    def test_overloaded_write_gets_503(
+        self,
+        client,
+        sample_task_data,
+        monkeypatch
+    ):
+        """Тест быстрого 503 с Retry-After при перегрузке записи."""
+        monkeypatch.setattr(admission.write_limiter, "max_concurrency", 0)
+        monkeypatch.setattr(admission.write_limiter, "max_queue", 0)
+        monkeypatch.setattr(admission.write_limiter, "_semaphore", None)
+
+        response = client.post("/tasks/", json=sample_task_data)
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        # Чтение при этом обслуживается
+        assert client.get("/tasks/").status_code == 200
+
+    def test_admission_metrics(self, client):
+        """Тест API метрик контроля допуска."""
+        client.get("/tasks/")
+
+        response = client.get("/metrics/admission")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["read"]["admitted"] >= 1
+        assert data["read"]["in_flight"] == 0
+        assert {"queued", "shed"} <= set(data["write"])
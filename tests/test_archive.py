@@ -0,0 +1,232 @@
+"""Тесты архивации завершенных задач."""
+from datetime import timedelta
+from sqlalchemy import event
+from app.crud import task as task_crud
+from app.crud.idempotency import IdempotencyCRUD
+from app.crud.task import TaskCRUD
+from app.database import utcnow
+from app.models.task import ArchivedTask, Task, TaskStatus
+from app.schemas.task import TaskCreate, TaskOrder, TaskUpdate
+
+
+def _create(db_session, title, status=TaskStatus.COMPLETED):
+    """Создание задачи с заданным статусом."""
+    return TaskCRUD.create_task(
+        db_session,
+        TaskCreate(title=title, status=status)
+    )
+
+
+def _archive_all(db_session, batch_size=100):
+    """Архивация всех завершенных к текущему моменту задач."""
+    return TaskCRUD.archive_completed(
+        db_session,
+        utcnow() + timedelta(seconds=1),
+        batch_size
+    )
+
+
+class TestTaskArchive:
+    """Тесты переноса задач в архив."""
+
+    def test_completed_at_tracks_status(self, db_session):
+        """Тест заполнения времени завершения при смене статуса."""
+        task = _create(db_session, "Задача", TaskStatus.CREATED)
+        assert task.completed_at is None
+
+        task = TaskCRUD.update_task(
+            db_session,
+            task.id,
+            TaskUpdate(status=TaskStatus.COMPLETED)
+        )
+        assert task.completed_at is not None
+
+        task = TaskCRUD.update_task(
+            db_session,
+            task.id,
+            TaskUpdate(status=TaskStatus.IN_PROGRESS)
+        )
+        assert task.completed_at is None
+
+    def test_archive_moves_only_old_completed(self, db_session):
+        """Тест: в архив переносятся только старые завершенные задачи."""
+        old_id = _create(db_session, "Старая").id
+        _create(db_session, "В работе", TaskStatus.IN_PROGRESS)
+
+        moved = TaskCRUD.archive_completed(
+            db_session,
+            utcnow() - timedelta(days=1),
+            100
+        )
+        assert moved == 0
+
+        assert _archive_all(db_session) == 1
+        assert db_session.query(Task).filter(Task.id == old_id).first() is None
+        assert db_session.get(ArchivedTask, old_id).title == "Старая"
+
+    def test_archive_task_created_with_idempotency_key(self, db_session):
+        """Тест: задача, созданная с ключом идемпотентности, архивируется."""
+        task, _ = IdempotencyCRUD.create_task(
+            db_session,
+            "key-1",
+            TaskCreate(title="Готовая", status=TaskStatus.COMPLETED)
+        )
+        assert db_session.get(Task, task.id).completed_at is not None
+
+        assert _archive_all(db_session) == 1
+        assert db_session.get(ArchivedTask, task.id) is not None
+
+    def test_archive_in_batches(self, db_session):
+        """Тест архивации пакетами ограниченного размера."""
+        for i in range(5):
+            _create(db_session, f"Задача {i}")
+
+        assert _archive_all(db_session, batch_size=2) == 2
+        assert _archive_all(db_session, batch_size=2) == 2
+        assert _archive_all(db_session, batch_size=2) == 1
+        assert db_session.query(ArchivedTask).count() == 5
+
+    def test_get_tasks_include_archived(self, db_session):
+        """Тест постраничного списка с архивными задачами."""
+        for title in ("A", "C", "E"):
+            _create(db_session, title)
+        _archive_all(db_session)
+        for title in ("B", "D"):
+            _create(db_session, title, TaskStatus.CREATED)
+
+        assert len(TaskCRUD.get_tasks(db_session)) == 2
+        tasks = TaskCRUD.get_tasks(db_session, include_archived=True)
+        assert [task.title for task in tasks] == ["A", "C", "E", "B", "D"]
+
+        tasks = TaskCRUD.get_tasks(
+            db_session,
+            include_archived=True,
+            order_by=TaskOrder.TITLE
+        )
+        assert [task.title for task in tasks] == ["A", "B", "C", "D", "E"]
+        assert isinstance(tasks[0], ArchivedTask)
+        assert isinstance(tasks[1], Task)
+
+        page = TaskCRUD.get_tasks(
+            db_session,
+            skip=1,
+            limit=2,
+            include_archived=True,
+            order_by=TaskOrder.TITLE
+        )
+        assert [task.title for task in page] == ["B", "C"]
+        page = TaskCRUD.get_tasks(
+            db_session,
+            skip=2,
+            limit=10,
+            include_archived=True,
+            order_by=TaskOrder.STATUS
+        )
+        assert [task.title for task in page] == ["E", "B", "D"]
+
+    def test_get_tasks_archive_page_single_query(self, db_session):
+        """Тест: страница архива не пересчитывает основную таблицу."""
+        for i in range(3):
+            _create(db_session, f"Архивная {i}")
+        _archive_all(db_session)
+        _create(db_session, "Активная", TaskStatus.CREATED)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            page = TaskCRUD.get_tasks(
+                db_session,
+                skip=2,
+                limit=10,
+                include_archived=True
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert [task.title for task in page] == ["Архивная 2", "Активная"]
+        assert not any("count(" in sql.lower() for sql in statements)
+        assert sum("UNION ALL" in sql for sql in statements) == 1
+
+    def test_get_tasks_archive_status_filter(self, db_session, monkeypatch):
+        """Тест: с фильтром по незавершенному статусу архив не читается."""
+        _create(db_session, "Архивная")
+        _archive_all(db_session)
+        _create(db_session, "Активная", TaskStatus.CREATED)
+        merged = []
+        merged_list_query = task_crud._merged_list_query
+
+        def record(*args):
+            merged.append(args)
+            return merged_list_query(*args)
+
+        monkeypatch.setattr(task_crud, "_merged_list_query", record)
+
+        tasks = TaskCRUD.get_tasks(
+            db_session,
+            status=TaskStatus.COMPLETED,
+            include_archived=True
+        )
+        assert [task.title for task in tasks] == ["Архивная"]
+        assert len(merged) == 1
+
+        tasks = TaskCRUD.get_tasks(
+            db_session,
+            status=TaskStatus.CREATED,
+            include_archived=True
+        )
+        assert [task.title for task in tasks] == ["Активная"]
+        assert len(merged) == 1
+
+
+class TestTaskArchiveAPI:
+    """Тесты API для архивных задач."""
+
+    def test_get_archived_task(self, client, db_session, sample_task_data):
+        """Тест API: архивная задача доступна по ID."""
+        data = dict(sample_task_data, status=TaskStatus.COMPLETED)
+        task_id = client.post("/tasks/", json=data).json()["id"]
+        _archive_all(db_session)
+
+        response = client.get(f"/tasks/{task_id}")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == task_id
+        assert client.get("/tasks/").json() == []
+        assert len(client.get("/tasks/?include_archived=true").json()) == 1
+
+    def test_update_archived_task(
+        self,
+        client,
+        db_session,
+        sample_task_data
+    ):
+        """Тест API: архивная задача не изменяется (409)."""
+        data = dict(sample_task_data, status=TaskStatus.COMPLETED)
+        task_id = client.post("/tasks/", json=data).json()["id"]
+        _archive_all(db_session)
+
+        response = client.put(f"/tasks/{task_id}", json={"title": "Новое"})
+
+        assert response.status_code == 409
+        assert "архиве" in response.json()["detail"]
+        assert client.get(f"/tasks/{task_id}").json()["title"] == (
+            sample_task_data["title"]
+        )
+
+    def test_delete_archived_task(
+        self,
+        client,
+        db_session,
+        sample_task_data
+    ):
+        """Тест API: удаление архивной задачи."""
+        data = dict(sample_task_data, status=TaskStatus.COMPLETED)
+        task_id = client.post("/tasks/", json=data).json()["id"]
+        _archive_all(db_session)
+
+        assert client.delete(f"/tasks/{task_id}").status_code == 204
+        assert client.get(f"/tasks/{task_id}").status_code == 404
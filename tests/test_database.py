@@ -0,0 +1,105 @@
+"""Тесты работы с базой данных из нескольких процессов."""
+import os
+import pytest
+from sqlalchemy.exc import OperationalError
+from app import database
+from app.database import retry_on_locked
+
+
+def _locked_error() -> OperationalError:
+    """Ошибка, которую SQLAlchemy выбрасывает при блокировке SQLite."""
+    return OperationalError(
+        "INSERT", {}, Exception("database is locked")
+    )
+
+
+class TestRetryOnLocked:
+    """Тесты повтора записи при блокировке базы данных."""
+
+    def test_retries_until_success(self, db_session, monkeypatch):
+        """Тест повтора операции после "database is locked"."""
+        monkeypatch.setattr(database, "DB_LOCK_BACKOFF_MS", 0)
+        calls = []
+
+        @retry_on_locked
+        def write(db):
+            calls.append(db)
+            if len(calls) < 3:
+                raise _locked_error()
+            return "ok"
+
+        assert write(db_session) == "ok"
+        assert len(calls) == 3
+
+    def test_gives_up_after_retries(self, db_session, monkeypatch):
+        """Тест: после исчерпания повторов ошибка пробрасывается."""
+        monkeypatch.setattr(database, "DB_LOCK_BACKOFF_MS", 0)
+        monkeypatch.setattr(database, "DB_LOCK_RETRIES", 2)
+        calls = []
+
+        @retry_on_locked
+        def write(db):
+            calls.append(db)
+            raise _locked_error()
+
+        with pytest.raises(OperationalError):
+            write(db=db_session)
+        assert len(calls) == 3
+
+    def test_other_errors_are_not_retried(self, db_session):
+        """Тест: прочие ошибки базы данных не повторяются."""
+        calls = []
+
+        @retry_on_locked
+        def write(db):
+            calls.append(db)
+            raise OperationalError("INSERT", {}, Exception("disk I/O"))
+
+        with pytest.raises(OperationalError):
+            write(db_session)
+        assert len(calls) == 1
+
+
+@pytest.fixture
+def isolated_engine(monkeypatch):
+    """Изоляция движка процесса: тест начинает без движка.
+
+    После теста созданные движки закрываются, а движок процесса
+    и привязка SessionLocal восстанавливаются.
+    """
+    bind = database.SessionLocal.kw.get("bind")
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_engine_pid", None)
+    created = []
+    original = database.get_engine
+
+    def get_engine():
+        engine = original()
+        if engine not in created:
+            created.append(engine)
+        return engine
+
+    monkeypatch.setattr(database, "get_engine", get_engine)
+    yield
+    for engine in created:
+        engine.dispose()
+    database.SessionLocal.configure(bind=bind)
+
+
+@pytest.mark.usefixtures("isolated_engine")
+class TestEnginePerProcess:
+    """Тесты создания движка в каждом процессе."""
+
+    def test_engine_recreated_in_new_process(self, monkeypatch):
+        """Тест: движок, созданный в другом процессе, не используется."""
+        engine = database.get_engine()
+        monkeypatch.setattr(database, "_engine_pid", os.getpid() + 1)
+
+        assert database.get_engine() is not engine
+
+    def test_engine_reset_after_fork(self):
+        """Тест сброса унаследованного движка в дочернем процессе."""
+        database.get_engine()
+        database._reset_engine_after_fork()
+
+        assert database._engine is None
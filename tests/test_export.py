@@ -0,0 +1,149 @@
+"""Тесты колоночного экспорта задач."""
+from datetime import timedelta
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from app.crud.task import TaskCRUD
+from app.database import Base, _set_sqlite_pragmas, utcnow
+from app.export import iter_arrow_stream
+from app.models.task import TaskStatus
+from app.schemas.task import TaskCreate
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _read_stream(content: bytes):
+    """Разбор ответа Arrow IPC stream в таблицу."""
+    return pa.ipc.open_stream(content).read_all()
+
+
+@pytest.mark.skipif(pa is None, reason="pyarrow не установлен")
+class TestArrowExport:
+    """Тесты GET /tasks/export.arrow."""
+
+    def test_export_all_tasks(self, client, db_session):
+        """Тест выгрузки задач пакетами со словарным статусом."""
+        statuses = list(TaskStatus)
+        for i in range(7):
+            TaskCRUD.create_task(db_session, TaskCreate(
+                title=f"Задача {i}",
+                status=statuses[i % len(statuses)]
+            ))
+
+        response = client.get("/tasks/export.arrow")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == (
+            "application/vnd.apache.arrow.stream"
+        )
+        table = _read_stream(response.content)
+        assert table.num_rows == 7
+        assert pa.types.is_dictionary(table.schema.field("status").type)
+        assert sorted(table.column("title").to_pylist()) == [
+            f"Задача {i}" for i in range(7)
+        ]
+        assert set(table.column("status").to_pylist()) == {
+            status.value for status in TaskStatus
+        }
+        for name in ("created_at", "updated_at"):
+            field = table.schema.field(name)
+            assert field.type == pa.timestamp("us", tz="UTC")
+            assert table.column(name).null_count == 0
+
+    def test_export_in_batches(self, db_session):
+        """Тест keyset пагинации по нескольким record batch'ам."""
+        tasks = [
+            TaskCRUD.create_task(db_session, TaskCreate(title=f"З{i}"))
+            for i in range(5)
+        ]
+        created = [task.created_at for task in tasks]
+
+        content = b"".join(iter_arrow_stream(db_session, batch_size=2))
+
+        batches = list(pa.ipc.open_stream(content))
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+        titles = [
+            title
+            for batch in batches
+            for title in batch.column("title").to_pylist()
+        ]
+        assert titles == [f"З{i}" for i in range(5)]
+        exported = [
+            value.replace(tzinfo=None)
+            for batch in batches
+            for value in batch.column("created_at").to_pylist()
+        ]
+        assert exported == created
+
+    def test_export_is_snapshot(self, tmp_path):
+        """Тест: архивация во время выгрузки не дублирует задачи."""
+        engine = create_engine(f"sqlite:///{tmp_path}/export.db")
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        Base.metadata.create_all(engine)
+        writer = Session(engine)
+        for i in range(4):
+            TaskCRUD.create_task(writer, TaskCreate(
+                title=f"T{i}",
+                status=TaskStatus.COMPLETED
+            ))
+
+        reader = Session(engine)
+        stream = iter_arrow_stream(
+            reader,
+            include_archived=True,
+            batch_size=2
+        )
+        # Схема потока и первый пакет
+        chunks = [next(stream), next(stream)]
+        archived = TaskCRUD.archive_completed(
+            writer,
+            utcnow() + timedelta(seconds=1),
+            100
+        )
+        chunks.extend(stream)
+        reader.close()
+        writer.close()
+        engine.dispose()
+
+        assert archived == 4
+        table = _read_stream(b"".join(chunks))
+        assert table.column("title").to_pylist() == [
+            f"T{i}" for i in range(4)
+        ]
+
+    def test_export_filters(self, client, db_session):
+        """Тест фильтра по статусу и архивных задач в экспорте."""
+        TaskCRUD.create_task(db_session, TaskCreate(title="Новая"))
+        TaskCRUD.create_task(db_session, TaskCreate(
+            title="Готовая",
+            status=TaskStatus.COMPLETED
+        ))
+        TaskCRUD.archive_completed(
+            db_session,
+            utcnow() + timedelta(seconds=1),
+            100
+        )
+
+        table = _read_stream(client.get("/tasks/export.arrow").content)
+        assert table.column("title").to_pylist() == ["Новая"]
+
+        table = _read_stream(client.get(
+            "/tasks/export.arrow?include_archived=true&status=завершено"
+        ).content)
+        assert table.column("title").to_pylist() == ["Готовая"]
+        assert table.column("completed_at").null_count == 0
+
+
+class TestArrowUnavailable:
+    """Тесты экспорта без установленного pyarrow."""
+
+    def test_export_without_pyarrow(self, client, monkeypatch):
+        """Тест ответа 501, если pyarrow недоступен."""
+        monkeypatch.setattr("app.api.tasks.arrow_available", lambda: False)
+
+        response = client.get("/tasks/export.arrow")
+
+        assert response.status_code == 501
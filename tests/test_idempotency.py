@@ -0,0 +1,125 @@
+"""Тесты ключей идемпотентности POST /tasks/."""
+import threading
+from datetime import timedelta
+from sqlalchemy.orm import Session
+from app.crud.idempotency import IdempotencyCRUD
+from app.crud.task import TaskCRUD
+from app.database import utcnow
+from app.models.idempotency import IdempotencyKey
+from app.schemas.task import TaskCreate
+
+
+class TestIdempotencyCRUD:
+    """Тесты хранилища ключей идемпотентности."""
+
+    def test_repeated_key_does_not_write(
+        self,
+        db_session,
+        sample_task_data
+    ):
+        """Тест: повтор с тем же ключом возвращает сохраненный ответ."""
+        task_create = TaskCreate(**sample_task_data)
+        first, first_replayed = IdempotencyCRUD.create_task(
+            db_session, "key-1", task_create
+        )
+        second, second_replayed = IdempotencyCRUD.create_task(
+            db_session, "key-1", task_create
+        )
+
+        assert first_replayed is False
+        assert second_replayed is True
+        assert second == first
+        assert len(TaskCRUD.get_tasks(db_session)) == 1
+
+    def test_expired_key_is_reused(self, db_session, sample_task_data):
+        """Тест: просроченный ключ создает задачу заново."""
+        task_create = TaskCreate(**sample_task_data)
+        first, _ = IdempotencyCRUD.create_task(
+            db_session, "key-1", task_create
+        )
+        stored = db_session.get(IdempotencyKey, "key-1")
+        stored.expires_at = utcnow() - timedelta(seconds=1)
+        db_session.commit()
+
+        second, replayed = IdempotencyCRUD.create_task(
+            db_session, "key-1", task_create
+        )
+
+        assert replayed is False
+        assert second.id != first.id
+
+    def test_purge_expired(self, db_session, sample_task_data):
+        """Тест удаления просроченных ключей пакетами."""
+        task_create = TaskCreate(**sample_task_data)
+        for key in ("old-1", "old-2", "fresh"):
+            IdempotencyCRUD.create_task(db_session, key, task_create)
+        for key in ("old-1", "old-2"):
+            stored = db_session.get(IdempotencyKey, key)
+            stored.expires_at = utcnow() - timedelta(seconds=1)
+        db_session.commit()
+
+        assert IdempotencyCRUD.purge_expired(db_session, 1) == 1
+        assert IdempotencyCRUD.purge_expired(db_session, 10) == 1
+        assert IdempotencyCRUD.purge_expired(db_session, 10) == 0
+        assert db_session.get(IdempotencyKey, "fresh") is not None
+
+    def test_concurrent_duplicates(self, db_session, sample_task_data):
+        """Тест: одновременные повторы создают одну задачу."""
+        task_create = TaskCreate(**sample_task_data)
+        engine = db_session.get_bind()
+        barrier = threading.Barrier(4)
+        results = []
+
+        def create():
+            with Session(bind=engine) as session:
+                barrier.wait()
+                result, _ = IdempotencyCRUD.create_task(
+                    session, "same-key", task_create
+                )
+                results.append(result.id)
+
+        threads = [threading.Thread(target=create) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4
+        assert len(set(results)) == 1
+        assert len(TaskCRUD.get_tasks(db_session)) == 1
+
+
+class TestIdempotencyAPI:
+    """Тесты заголовка Idempotency-Key."""
+
+    def test_retry_returns_same_task(self, client, sample_task_data):
+        """Тест API: повтор запроса не создает дубликат."""
+        headers = {"Idempotency-Key": "retry-1"}
+        first = client.post("/tasks/", json=sample_task_data, headers=headers)
+        second = client.post(
+            "/tasks/", json=sample_task_data, headers=headers
+        )
+
+        assert first.status_code == 201
+        assert second.status_code == 201
+        assert second.json() == first.json()
+        assert second.headers["idempotent-replayed"] == "true"
+        assert len(client.get("/tasks/").json()) == 1
+
+    def test_key_reused_with_other_data(self, client, sample_task_data):
+        """Тест API: ключ с другим телом запроса отклоняется."""
+        headers = {"Idempotency-Key": "retry-1"}
+        client.post("/tasks/", json=sample_task_data, headers=headers)
+
+        other = dict(sample_task_data, title="Другая задача")
+        response = client.post("/tasks/", json=other, headers=headers)
+
+        assert response.status_code == 422
+        assert len(client.get("/tasks/").json()) == 1
+
+    def test_without_key_creates_duplicates(self, client, sample_task_data):
+        """Тест API: без ключа каждый запрос создает задачу."""
+        client.post("/tasks/", json=sample_task_data)
+        client.post("/tasks/", json=sample_task_data)
+
+        assert len(client.get("/tasks/").json()) == 2
@@ -0,0 +1,82 @@
+"""Тесты миграций и запуска приложения."""
+import subprocess
+import sys
+from pathlib import Path
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from app.database import Base
+from app.migrate import (
+    BASELINE_REVISION,
+    get_alembic_config,
+    upgrade_database,
+)
+
+
+class TestMigrations:
+    """Тесты управления схемой через Alembic."""
+
+    def test_upgrade_creates_schema(self, tmp_path):
+        """Тест применения миграций к пустой базе данных."""
+        url = f"sqlite:///{tmp_path}/migrate.db"
+        upgrade_database(url)
+
+        engine = create_engine(url)
+        tables = inspect(engine).get_table_names()
+        engine.dispose()
+
+        assert "tasks" in tables
+        assert "alembic_version" in tables
+
+    def test_migrations_match_models(self, tmp_path):
+        """Тест соответствия миграций моделям SQLAlchemy."""
+        url = f"sqlite:///{tmp_path}/migrate.db"
+        upgrade_database(url)
+
+        engine = create_engine(url)
+        with engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            diff = compare_metadata(context, Base.metadata)
+        engine.dispose()
+
+        assert diff == []
+
+    def test_upgrade_legacy_database(self, tmp_path):
+        """Тест перевода базы, созданной create_all, на миграции."""
+        url = f"sqlite:///{tmp_path}/legacy.db"
+        # Схема, которую создавал create_all до перехода на миграции
+        upgrade_database(url, revision=BASELINE_REVISION)
+        engine = create_engine(url)
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE alembic_version"))
+
+        upgrade_database(url)
+
+        with engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            current = context.get_current_revision()
+        assert current == ScriptDirectory.from_config(
+            get_alembic_config(url)
+        ).get_current_head()
+        engine.dispose()
+
+
+class TestStartup:
+    """Тесты легковесного импорта приложения."""
+
+    def test_import_does_not_touch_database(self):
+        """Тест: импорт app.main не создает движок и не грузит alembic."""
+        code = (
+            "import sys, app.main, app.database; "
+            "assert app.database._engine is None; "
+            "assert 'alembic' not in sys.modules"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,131 @@
+"""Тесты планов запросов списка задач (EXPLAIN QUERY PLAN)."""
+import itertools
+import pytest
+from sqlalchemy import text
+from app.crud.task import (
+    _list_query,
+    _merged_list_query,
+    archive_may_contain,
+)
+from app.database import utcnow
+from app.export import export_query
+from app.models.task import ArchivedTask, Task, TaskStatus
+from app.schemas.task import TaskOrder
+
+STATUSES = [None, TaskStatus.CREATED, TaskStatus.COMPLETED]
+PREFIXES = [None, "Зада"]
+ORDERS = [None, *TaskOrder]
+
+# Фильтр по префиксу поддерживается только с сортировкой по названию,
+# архив читается только для статусов, которые в нем могут быть
+COMBINATIONS = [
+    (model, status, prefix, order)
+    for model, status, prefix, order in itertools.product(
+        [Task, ArchivedTask], STATUSES, PREFIXES, ORDERS
+    )
+    if (prefix is None or order in (None, TaskOrder.TITLE))
+    and (model is Task or archive_may_contain(status))
+]
+MERGED = [
+    (status, prefix, order)
+    for model, status, prefix, order in COMBINATIONS
+    if model is ArchivedTask
+]
+EXPORTS = [
+    (model, status, after)
+    for model, status, after in itertools.product(
+        [Task, ArchivedTask], STATUSES, [None, (utcnow(), 1)]
+    )
+    if model is Task or archive_may_contain(status)
+]
+
+
+def _query_plan(db_session, query):
+    """Строки EXPLAIN QUERY PLAN для запроса ORM или select()."""
+    statement = getattr(query, "statement", query)
+    sql = statement.compile(
+        dialect=db_session.get_bind().dialect,
+        compile_kwargs={"literal_binds": True}
+    )
+    rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return [row[-1] for row in rows]
+
+
+def _assert_index_plan(db_session, query):
+    """Проверка плана: чтение по индексу без сортировки.
+
+    Без условий допустим проход по индексу в нужном порядке (его
+    ограничивает LIMIT), с условиями - только поиск по индексу:
+    SCAN ... USING INDEX с фильтром прошел бы весь индекс.
+    """
+    statement = getattr(query, "statement", query)
+    plan = _query_plan(db_session, query)
+
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+    _assert_index_steps(statement, plan)
+
+
+def _assert_index_steps(statement, plan):
+    """Проверка шагов плана одного SELECT."""
+    if statement.whereclause is None:
+        assert all("USING" in step for step in plan), plan
+    else:
+        assert all(step.startswith("SEARCH") for step in plan), plan
+
+
+@pytest.mark.parametrize(
+    "model,status,title_prefix,order_by",
+    COMBINATIONS,
+    ids=lambda value: getattr(value, "__name__", str(value))
+)
+def test_list_query_uses_index(
+    db_session,
+    model,
+    status,
+    title_prefix,
+    order_by
+):
+    """Тест: список задач читается по индексу без сортировки."""
+    query = _list_query(
+        db_session, model, status, title_prefix, order_by
+    ).offset(20).limit(10)
+
+    _assert_index_plan(db_session, query)
+
+
+@pytest.mark.parametrize(
+    "status,title_prefix,order_by",
+    MERGED,
+    ids=str
+)
+def test_merged_list_query_uses_index(
+    db_session,
+    status,
+    title_prefix,
+    order_by
+):
+    """Тест: список с архивом сливает обе таблицы без сортировки."""
+    query = _merged_list_query(
+        status, title_prefix, order_by
+    ).offset(20).limit(10)
+
+    plan = _query_plan(db_session, query)
+
+    assert plan[:2] == ["MERGE (UNION ALL)", "LEFT"], plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+    right = plan.index("RIGHT")
+    hot, archived = query.selects
+    _assert_index_steps(hot, plan[2:right])
+    _assert_index_steps(archived, plan[right + 1:])
+
+
+@pytest.mark.parametrize(
+    "model,status,after",
+    EXPORTS,
+    ids=lambda value: getattr(value, "__name__", str(value))
+)
+def test_export_query_uses_index(db_session, model, status, after):
+    """Тест: пакет экспорта читается по индексу без сортировки."""
+    query = export_query(model, status, 1000, after)
+
+    _assert_index_plan(db_session, query)
@@ -1,7 +1,7 @@
 """Тесты для API задач."""
 from app.models.task import TaskStatus
-from app.crud.task import TaskCRUD
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.crud.task import TaskCRUD, prefix_upper_bound
+from app.schemas.task import TaskCreate, TaskOrder, TaskUpdate
 
 
 class TestTaskCRUD:
@@ -70,6 +70,50 @@ class TestTaskCRUD:
         assert len(tasks) == 1
         assert tasks[0].status == TaskStatus.CREATED
 
+    def test_get_tasks_ordered(self, db_session, sample_task_data):
+        """Тест сортировки списка задач."""
+        titles = ["Б", "В", "А"]
+        statuses = [
+            TaskStatus.COMPLETED,
+            TaskStatus.CREATED,
+            TaskStatus.IN_PROGRESS
+        ]
+        for title, status in zip(titles, statuses):
+            task_data = dict(sample_task_data, title=title, status=status)
+            TaskCRUD.create_task(db_session, TaskCreate(**task_data))
+
+        by_title = TaskCRUD.get_tasks(db_session, order_by=TaskOrder.TITLE)
+        by_created = TaskCRUD.get_tasks(
+            db_session,
+            order_by=TaskOrder.CREATED_AT
+        )
+        by_status = TaskCRUD.get_tasks(
+            db_session,
+            order_by=TaskOrder.STATUS
+        )
+
+        assert [task.title for task in by_title] == ["А", "Б", "В"]
+        assert [task.title for task in by_created] == titles
+        # Статусы хранятся по именам: COMPLETED < CREATED < IN_PROGRESS
+        assert [task.title for task in by_status] == titles
+
+    def test_get_tasks_title_prefix(self, db_session, sample_task_data):
+        """Тест фильтра по началу названия."""
+        for title in ["Отчет 2", "Отчет 1", "Отпуск", "Обзор"]:
+            task_data = dict(sample_task_data, title=title)
+            TaskCRUD.create_task(db_session, TaskCreate(**task_data))
+
+        tasks = TaskCRUD.get_tasks(db_session, title_prefix="Отч")
+
+        assert [task.title for task in tasks] == ["Отчет 1", "Отчет 2"]
+
+    def test_prefix_upper_bound(self):
+        """Тест верхней границы диапазона префикса."""
+        assert prefix_upper_bound("abc") == "abd"
+        assert prefix_upper_bound("Отч") == "Отш"
+        assert prefix_upper_bound("a\U0010ffff") == "b"
+        assert prefix_upper_bound("\U0010ffff") is None
+
     def test_update_task(
         self,
         db_session,
@@ -220,6 +264,29 @@ class TestTaskAPI:
         assert len(data) == 1
         assert data[0]["status"] == "создано"
 
+    def test_get_tasks_sorted_api(self, client, sample_task_data):
+        """Тест API сортировки и фильтра по префиксу."""
+        for title in ["Задача Б", "Задача А", "Заметка"]:
+            task_data = dict(sample_task_data, title=title)
+            client.post("/tasks/", json=task_data)
+
+        response = client.get("/tasks/?order_by=title")
+        assert [task["title"] for task in response.json()] == [
+            "Задача А",
+            "Задача Б",
+            "Заметка"
+        ]
+
+        response = client.get("/tasks/?title_prefix=Задача")
+        assert [task["title"] for task in response.json()] == [
+            "Задача А",
+            "Задача Б"
+        ]
+
+        data = response.json()[0]
+        assert data["created_at"] is not None
+        assert data["updated_at"] is not None
+
     def test_update_task_api(
         self,
         client,
@@ -315,3 +382,15 @@ class TestTaskValidation:
         # Слишком большой limit
         response = client.get("/tasks/?limit=1001")
         assert response.status_code == 422
+
+    def test_ordering_validation(self, client):
+        """Тест валидации параметров сортировки."""
+        # Неизвестная сортировка
+        response = client.get("/tasks/?order_by=description")
+        assert response.status_code == 422
+
+        # Префикс названия с сортировкой не по названию
+        response = client.get(
+            "/tasks/?title_prefix=За&order_by=created_at"
+        )
+        assert response.status_code == 422